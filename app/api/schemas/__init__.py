@@ -1,17 +1,23 @@
 """Pydantic schemas package for request/response models."""
 
 from .experiment import ExperimentMessageCreateRequest, ExperimentThreadCreateRequest
-from .ingest import RecipeIngestionRequest, RecipeUrlPreviewRequest
+from .ingest import (
+    RecipeBatchIngestionRequest,
+    RecipeIngestionRequest,
+    RecipeUrlPreviewRequest,
+)
 from .grocery_list import GroceryListCreateRequest
 from .recipe import Recipe
-from .recipe_book import RecipeBookCreateRequest
+from .recipe_book import RecipeBookCreateRequest, RecipeBookRecipesAddRequest
 
 __all__ = [
     "Recipe",
     "ExperimentMessageCreateRequest",
     "ExperimentThreadCreateRequest",
+    "RecipeBatchIngestionRequest",
     "RecipeIngestionRequest",
     "RecipeUrlPreviewRequest",
     "RecipeBookCreateRequest",
+    "RecipeBookRecipesAddRequest",
     "GroceryListCreateRequest",
 ]
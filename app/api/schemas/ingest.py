@@ -51,6 +51,17 @@ class RecipeIngestionRequest(BaseModel):
     )
 
 
+class RecipeBatchIngestionRequest(BaseModel):
+    """Request model for processing several raw recipes in one call."""
+
+    items: list[RecipeIngestionRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=10,
+        description="Recipes to process concurrently; results keep request order.",
+    )
+
+
 class RecipeUrlPreviewRequest(BaseModel):
     """Request model for recipe preview extraction from a source URL."""
 
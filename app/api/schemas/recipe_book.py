@@ -1,4 +1,5 @@
 from typing import Optional
+from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -21,3 +22,20 @@ class RecipeBookCreateRequest(BaseModel):
         max_length=1000,
         json_schema_extra={"example": "My favorite pasta and risotto recipes"},
     )
+
+
+class RecipeBookRecipesAddRequest(BaseModel):
+    """Request model for adding several recipes to a recipe book at once."""
+
+    recipe_ids: list[UUID] = Field(
+        ...,
+        min_length=1,
+        max_length=100,
+        description="Recipe IDs to add to the recipe book.",
+        json_schema_extra={
+            "example": [
+                "11111111-1111-1111-1111-111111111111",
+                "22222222-2222-2222-2222-222222222222",
+            ]
+        },
+    )
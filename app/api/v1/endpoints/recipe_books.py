@@ -3,7 +3,7 @@ from uuid import UUID
 
 from fastapi import APIRouter, Body, Depends, HTTPException, Query
 
-from app.api.schemas import RecipeBookCreateRequest
+from app.api.schemas import RecipeBookCreateRequest, RecipeBookRecipesAddRequest
 from app.core.config import settings
 from app.core.dependencies import get_recipe_book_manager
 from app.core.logging import get_logger
@@ -146,6 +146,42 @@ def get_recipe_book(
         raise HTTPException(status_code=500, detail="Error getting recipe book") from e
 
 
+@router.post("/{recipe_book_id}/recipes/batch")
+def add_recipes_to_book(
+    recipe_book_id: UUID,
+    recipes_request: RecipeBookRecipesAddRequest = RECIPE_BOOK_BODY,
+    recipe_book_manager=recipe_book_manager_dep,
+) -> dict:
+    """
+    Add several recipes to a recipe book (idempotent).
+
+    Recipes that don't exist are skipped and reported in missing_recipe_ids.
+    """
+    recipe_book_id_str = str(recipe_book_id)
+    recipe_ids = [str(recipe_id) for recipe_id in recipes_request.recipe_ids]
+    try:
+        result = recipe_book_manager.add_recipes_to_book(recipe_book_id_str, recipe_ids)
+        if not result["book_exists"]:
+            raise HTTPException(status_code=404, detail="Recipe book not found")
+
+        return {
+            "recipe_book_id": recipe_book_id_str,
+            "added_recipe_ids": result["added_recipe_ids"],
+            "missing_recipe_ids": result["missing_recipe_ids"],
+            "added": len(result["added_recipe_ids"]),
+            "success": True,
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception(
+            "Error adding recipes to recipe book %s: %s", recipe_book_id_str, e
+        )
+        raise HTTPException(
+            status_code=500, detail="Error adding recipes to recipe book"
+        ) from e
+
+
 @router.put("/{recipe_book_id}/recipes/{recipe_id}")
 def add_recipe_to_book(
     recipe_book_id: UUID,
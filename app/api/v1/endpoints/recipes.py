@@ -1,9 +1,12 @@
+import asyncio
 from uuid import UUID
 
 from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request
+from starlette.concurrency import run_in_threadpool
 
 from app.api.schemas import (
     GroceryListCreateRequest,
+    RecipeBatchIngestionRequest,
     RecipeIngestionRequest,
     RecipeUrlPreviewRequest,
 )
@@ -13,7 +16,11 @@ from app.api.v1.helpers.recipe_search import (
     normalize_search_query,
 )
 from app.api.v1.helpers.recipe_pagination import RecipePaginationCursor
-from app.core.cache import hash_cache_key, semantic_search_cache
+from app.core.cache import (
+    hash_cache_key,
+    recipe_preview_cache,
+    semantic_search_cache,
+)
 from app.core.config import settings
 from app.core.dependencies import (
     get_grocery_list_aggregation_service,
@@ -91,6 +98,64 @@ def process_and_store_recipe(
     Takes raw unstructured recipe text and returns the database ID
     of the stored recipe, or an error if processing fails.
     """
+    return _process_and_store(ingestion_request, processing_service, recipe_manager)
+
+
+@router.post("/process-and-store/batch")
+async def process_and_store_recipes_batch(
+    batch_request: RecipeBatchIngestionRequest = RECIPE_BODY,
+    processing_service=recipe_processing_service_dep,
+    recipe_manager=recipe_manager_dep,
+) -> dict:
+    """
+    Run the process-and-store pipeline for several recipes concurrently.
+
+    Each item is processed on its own worker thread so the LLM calls overlap;
+    the batch takes roughly as long as its slowest item. Results are returned
+    in request order and a failing item does not fail the rest of the batch.
+    Identical items that enforce deduplication are processed once and share a
+    result, since concurrent copies would all miss the dedupe lookup.
+    """
+    unique_items: dict[str, RecipeIngestionRequest] = {}
+    item_keys: list[str] = []
+    for index, item in enumerate(batch_request.items):
+        key = item.model_dump_json() if item.enforce_deduplication else f"#{index}"
+        unique_items.setdefault(key, item)
+        item_keys.append(key)
+
+    outcomes = await asyncio.gather(
+        *(
+            run_in_threadpool(
+                _process_and_store, item, processing_service, recipe_manager
+            )
+            for item in unique_items.values()
+        ),
+        return_exceptions=True,
+    )
+    outcome_by_key = dict(zip(unique_items, outcomes, strict=True))
+
+    results = []
+    for key in item_keys:
+        outcome = outcome_by_key[key]
+        if isinstance(outcome, HTTPException):
+            results.append({"error": outcome.detail, "success": False})
+        elif isinstance(outcome, Exception):
+            logger.exception("Batch recipe processing failed", exc_info=outcome)
+            results.append({"error": "Recipe processing failed", "success": False})
+        else:
+            results.append(outcome)
+
+    return {
+        "results": results,
+        "success": all(result.get("success") for result in results),
+    }
+
+
+def _process_and_store(
+    ingestion_request: RecipeIngestionRequest,
+    processing_service,
+    recipe_manager,
+) -> dict:
     source_url = (
         str(ingestion_request.source_url) if ingestion_request.source_url else None
     )
@@ -163,15 +228,26 @@ def process_and_store_recipe(
 @router.post("/preview-from-url")
 def preview_recipe_from_url(
     preview_request: RecipeUrlPreviewRequest = RECIPE_BODY,
+    no_cache: bool = Query(
+        default=False,
+        description="Bypass cached previews and fetch the URL again",
+    ),
     processing_service=recipe_processing_service_dep,
 ) -> dict:
     """
     Fetch a URL and run the cleanup+extraction pipeline without storing data.
 
     Returns a recipe preview payload suitable for user confirmation prior to
-    calling process-and-store.
+    calling process-and-store. Successful previews are cached per URL.
     """
     source_url = str(preview_request.url)
+    cache_key = hash_cache_key("recipe_preview", source_url)
+    if not no_cache:
+        cached_response = recipe_preview_cache.get(cache_key)
+        if cached_response is not None:
+            logger.info("Recipe preview cache hit url='%s'", source_url)
+            return cached_response
+
     recipe, error, diagnostics = processing_service.preview_recipe_from_url(source_url)
 
     if error:
@@ -191,7 +267,7 @@ def preview_recipe_from_url(
             "error": "Recipe preview did not return data",
         }
 
-    return {
+    response_payload = {
         "success": True,
         "created": False,
         "url": source_url,
@@ -201,6 +277,8 @@ def preview_recipe_from_url(
             "Recipe preview generated successfully. No database insertion performed."
         ),
     }
+    recipe_preview_cache.set(cache_key, response_payload)
+    return response_payload
 
 
 @router.get("/")
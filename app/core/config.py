@@ -44,6 +44,9 @@ class Settings:
         self.REQUEST_TIMEOUT_SECONDS: float = self._cfg.getfloat(
             "api", "request_timeout_seconds", fallback=120.0
         )
+        self.THREADPOOL_MAX_WORKERS: int = max(
+            1, self._cfg.getint("api", "threadpool_max_workers", fallback=100)
+        )
         self.API_AUTH_TOKEN: str = os.getenv("API_AUTH_TOKEN", "").strip()
         self.SEMANTIC_SEARCH_MAX_DISTANCE: float = self._cfg.getfloat(
             "api", "semantic_search_max_distance", fallback=0.22
@@ -126,6 +129,28 @@ class Settings:
         self.DB_POOL_MAXCONN: int = self._cfg.getint(
             "database", "pool_maxconn", fallback=10
         )
+        self.DB_POOL_TIMEOUT_SECONDS: float = self._cfg.getfloat(
+            "database", "pool_timeout_seconds", fallback=10.0
+        )
+        self.DB_PREPARED_STATEMENTS: bool = self._cfg.getboolean(
+            "database", "prepared_statements", fallback=True
+        )
+        self.DB_HNSW_EF_SEARCH: int = self._cfg.getint(
+            "database", "hnsw_ef_search", fallback=100
+        )
+        self.DB_JIT: bool = self._cfg.getboolean("database", "jit", fallback=False)
+        self.DB_APPLICATION_NAME: str = self._cfg.get(
+            "database", "application_name", fallback="forkfolio"
+        )
+        self.DB_STATEMENT_TIMEOUT_MS: int = self._cfg.getint(
+            "database", "statement_timeout_ms", fallback=0
+        )
+        self.DB_IDLE_IN_TRANSACTION_TIMEOUT_MS: int = self._cfg.getint(
+            "database", "idle_in_transaction_timeout_ms", fallback=0
+        )
+        self.DB_KEEPALIVES_IDLE: int = self._cfg.getint(
+            "database", "keepalives_idle", fallback=30
+        )
 
         # LLM + embeddings
         self.LLM_MODEL_NAME: str = self._cfg.get(
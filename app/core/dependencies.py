@@ -1,7 +1,12 @@
 """
 Dependency injection providers for the application.
+
+Services and managers hold no per-request state, so each provider builds its
+instance once and FastAPI reuses it for every request.
 """
 
+from functools import lru_cache
+
 from app.services.experiment_service import ExperimentService
 from app.services.data.managers.experiment_manager import ExperimentManager
 from app.services.data.managers.recipe_book_manager import RecipeBookManager
@@ -12,6 +17,7 @@ from app.services.recipe_processing_service import RecipeProcessingService
 from app.services.recipe_search_reranker_impl import RecipeSearchRerankerServiceImpl
 
 
+@lru_cache
 def get_recipe_manager() -> RecipeManager:
     """
     Dependency provider for RecipeManager.
@@ -22,11 +28,13 @@ def get_recipe_manager() -> RecipeManager:
     return RecipeManager()
 
 
+@lru_cache
 def get_experiment_manager() -> ExperimentManager:
     """Dependency provider for ExperimentManager."""
     return ExperimentManager()
 
 
+@lru_cache
 def get_recipe_book_manager() -> RecipeBookManager:
     """
     Dependency provider for RecipeBookManager.
@@ -37,26 +45,34 @@ def get_recipe_book_manager() -> RecipeBookManager:
     return RecipeBookManager()
 
 
+@lru_cache
 def get_recipe_embeddings_service() -> RecipeEmbeddingsServiceImpl:
     """Dependency provider for RecipeEmbeddingsServiceImpl."""
     return RecipeEmbeddingsServiceImpl()
 
 
+@lru_cache
 def get_recipe_search_reranker_service() -> RecipeSearchRerankerServiceImpl:
     """Dependency provider for RecipeSearchRerankerServiceImpl."""
     return RecipeSearchRerankerServiceImpl()
 
 
+@lru_cache
 def get_grocery_list_aggregation_service() -> GroceryListAggregationServiceImpl:
     """Dependency provider for GroceryListAggregationServiceImpl."""
     return GroceryListAggregationServiceImpl()
 
 
+@lru_cache
 def get_recipe_processing_service() -> RecipeProcessingService:
     """Dependency provider for RecipeProcessingService."""
-    return RecipeProcessingService()
+    return RecipeProcessingService(
+        recipe_manager=get_recipe_manager(),
+        embeddings_service=get_recipe_embeddings_service(),
+    )
 
 
+@lru_cache
 def get_experiment_service() -> ExperimentService:
     """Dependency provider for ExperimentService."""
     return ExperimentService(
@@ -180,16 +180,18 @@ class RequestSizeLimitMiddleware:
             await self.app(scope, receive, send)
             return
 
-        headers = {
-            key.decode("latin-1").lower(): value.decode("latin-1")
-            for key, value in scope.get("headers", [])
-        }
-        content_length = headers.get("content-length")
-        if content_length and content_length.isdigit():
+        content_length = _header_value(scope, b"content-length")
+        if content_length is not None and content_length.isdigit():
             if int(content_length) > self._max_body_size:
                 await _send_size_limit_response(scope, receive, send)
                 return
+            # The server enforces the declared length, so the body cannot
+            # exceed the limit and there is nothing to count.
+            await self.app(scope, receive, send)
+            return
 
+        # Unknown length (e.g. chunked): buffer while counting so oversized
+        # bodies are rejected before the app sees them.
         buffered_messages = []
         received = 0
         while True:
@@ -221,6 +223,13 @@ def _get_client_ip(request: Request) -> str:
     return "unknown"
 
 
+def _header_value(scope, name: bytes) -> str | None:
+    for key, value in scope.get("headers", []):
+        if key.lower() == name:
+            return value.decode("latin-1")
+    return None
+
+
 def _normalize_path(path: str) -> str:
     normalized = path.strip() or "/"
     if not normalized.startswith("/"):
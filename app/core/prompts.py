@@ -1,6 +1,27 @@
+from functools import lru_cache
+
 from app.core.config import settings
 
-RECIPE_EXTRACTION_SYSTEM_PROMPT = """
+
+def _compact_prompt(prompt: str) -> str:
+    """
+    Canonicalize a prompt literal before it is sent to the model.
+
+    Trailing spaces, leading/trailing blank lines, and repeated blank lines are
+    dropped so every call sends the same minimal, stable prefix (which also
+    keeps provider-side prompt caching effective). Line structure is kept.
+    """
+    lines = [line.rstrip() for line in prompt.strip().splitlines()]
+    compacted: list[str] = []
+    for line in lines:
+        if not line and compacted and not compacted[-1]:
+            continue
+        compacted.append(line)
+    return "\n".join(compacted)
+
+
+RECIPE_EXTRACTION_SYSTEM_PROMPT = _compact_prompt(
+    """
 You are a precise and reliable assistant that extracts structured recipe data from
 unstructured text. You always return ONLY a valid JSON object conforming to the
 specified schema—no extra commentary, explanation, or notes.
@@ -41,6 +62,7 @@ Example:
 "instructions": ["Boil pasta", "Add sauce"], "servings": "Not specified", 
 "total_time": "Not specified"}
 """
+)
 
 # System prompt for cleaning up messy input data before recipe extraction.
 _CLEANUP_SYSTEM_PROMPT_TEMPLATE = """
@@ -103,20 +125,28 @@ def _cleanup_temperature_guidance(unit_system: str) -> str:
     return 'Keep temperatures in Fahrenheit with °F (e.g., "350°F")'
 
 
+@lru_cache(maxsize=4)
+def _render_cleanup_system_prompt(unit_system: str) -> str:
+    return _compact_prompt(
+        _CLEANUP_SYSTEM_PROMPT_TEMPLATE.format(
+            temperature_guidance=_cleanup_temperature_guidance(unit_system)
+        )
+    )
+
+
 def build_cleanup_system_prompt(unit_system: str | None = None) -> str:
     normalized_unit_system = (
         (unit_system or settings.RECIPE_UNIT_SYSTEM).strip().lower()
     )
     if normalized_unit_system not in {"us", "metric", "both"}:
         normalized_unit_system = "us"
-    return _CLEANUP_SYSTEM_PROMPT_TEMPLATE.format(
-        temperature_guidance=_cleanup_temperature_guidance(normalized_unit_system)
-    )
+    return _render_cleanup_system_prompt(normalized_unit_system)
 
 
 CLEANUP_SYSTEM_PROMPT = build_cleanup_system_prompt()
 
-DEDUPLICATION_SYSTEM_PROMPT = """
+DEDUPLICATION_SYSTEM_PROMPT = _compact_prompt(
+    """
 You are an expert cooking assistant. Determine if two recipes are essentially
 the same dish with only minor variations (duplicate) or materially different
 (distinct). Consider ingredients and instructions.
@@ -124,9 +154,11 @@ the same dish with only minor variations (duplicate) or materially different
 Return ONLY valid JSON in this schema:
 {"decision": "duplicate" | "distinct", "reason": "short explanation"}
 """
+)
 
 
-SEARCH_RERANK_SYSTEM_PROMPT = """
+SEARCH_RERANK_SYSTEM_PROMPT = _compact_prompt(
+    """
 You are a recipe search reranker. You receive a user query and candidate recipes
 that were retrieved by embeddings. Re-rank candidates by how relevant they are
 to the query intent.
@@ -156,9 +188,11 @@ Score calibration guide:
 - 0.30-0.49: Partially related.
 - 0.00-0.29: Weakly related or unrelated.
 """
+)
 
 
-GROCERY_LIST_AGGREGATION_SYSTEM_PROMPT = """
+GROCERY_LIST_AGGREGATION_SYSTEM_PROMPT = _compact_prompt(
+    """
 You are a grocery list assistant. You receive ingredients from multiple recipes and
 must merge them into one simple grocery list.
 
@@ -186,6 +220,7 @@ Rules:
   spices, frozen, other).
 - Return an empty ingredients list if input ingredients are empty.
 """
+)
 
 
 EXPERIMENT_AGENT_SCOPE_REFUSAL = (
@@ -194,7 +229,8 @@ EXPERIMENT_AGENT_SCOPE_REFUSAL = (
 )
 
 
-EXPERIMENT_AGENT_SYSTEM_PROMPT = """
+EXPERIMENT_AGENT_SYSTEM_PROMPT = _compact_prompt(
+    """
 You are the ForkFolio Experiment Agent.
 
 Core mission:
@@ -226,3 +262,4 @@ Output rules when in scope:
 - Include ingredient ideas and a step outline when useful.
 - Include substitution notes for modification requests.
 """
+)
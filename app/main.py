@@ -1,6 +1,7 @@
 from contextlib import asynccontextmanager
 from copy import deepcopy
 
+import anyio.to_thread
 from dotenv import load_dotenv
 from fastapi import FastAPI
 from fastapi.openapi.utils import get_openapi
@@ -173,6 +174,13 @@ def _customize_openapi_schema(
     return application.openapi_schema
 
 
+def _configure_threadpool(max_workers: int) -> None:
+    # Sync endpoints run in AnyIO's worker threads and each LLM-backed request
+    # holds one for seconds, so the default of 40 queues requests under load.
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    limiter.total_tokens = max(1, max_workers)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Load environment variables on startup
@@ -187,6 +195,8 @@ async def lifespan(app: FastAPI):
         settings.MAX_REQUEST_SIZE_MB,
         settings.REQUEST_TIMEOUT_SECONDS,
     )
+    _configure_threadpool(settings.THREADPOOL_MAX_WORKERS)
+    logger.info("Threadpool max workers: %s", settings.THREADPOOL_MAX_WORKERS)
     if settings.API_AUTH_TOKEN:
         logger.info("API auth token: enabled")
     else:
@@ -1,21 +1,32 @@
 """Business logic and services package."""
 
-from .recipe_extractor_impl import RecipeExtractorImpl
-from .recipe_input_cleanup_impl import RecipeInputCleanupServiceImpl
-from .recipe_embeddings_impl import RecipeEmbeddingsServiceImpl
-from .recipe_dedupe_impl import RecipeDedupeServiceImpl
-from .recipe_search_reranker import RecipeSearchRerankerService
-from .recipe_search_reranker_impl import RecipeSearchRerankerServiceImpl
-from .grocery_list_aggregation import GroceryListAggregationService
-from .grocery_list_aggregation_impl import GroceryListAggregationServiceImpl
+import importlib
+from typing import Any
 
-__all__ = [
-    "RecipeExtractorImpl",
-    "RecipeInputCleanupServiceImpl",
-    "RecipeEmbeddingsServiceImpl",
-    "RecipeDedupeServiceImpl",
-    "RecipeSearchRerankerService",
-    "RecipeSearchRerankerServiceImpl",
-    "GroceryListAggregationService",
-    "GroceryListAggregationServiceImpl",
-]
+# Exported services are imported on first access (PEP 562), so importing one
+# submodule does not pull in every service and its LLM/DB dependencies.
+_LAZY = {
+    "RecipeExtractorImpl": ".recipe_extractor_impl",
+    "RecipeInputCleanupServiceImpl": ".recipe_input_cleanup_impl",
+    "RecipeEmbeddingsServiceImpl": ".recipe_embeddings_impl",
+    "RecipeDedupeServiceImpl": ".recipe_dedupe_impl",
+    "RecipeSearchRerankerService": ".recipe_search_reranker",
+    "RecipeSearchRerankerServiceImpl": ".recipe_search_reranker_impl",
+    "GroceryListAggregationService": ".grocery_list_aggregation",
+    "GroceryListAggregationServiceImpl": ".grocery_list_aggregation_impl",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
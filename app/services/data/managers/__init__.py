@@ -1,5 +1,24 @@
-from .experiment_manager import ExperimentManager
-from .recipe_manager import RecipeManager
-from .recipe_book_manager import RecipeBookManager
+import importlib
+from typing import Any
 
-__all__ = ["ExperimentManager", "RecipeManager", "RecipeBookManager"]
+# Managers are imported on first access (PEP 562).
+_LAZY = {
+    "ExperimentManager": ".experiment_manager",
+    "RecipeManager": ".recipe_manager",
+    "RecipeBookManager": ".recipe_book_manager",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,30 +1,163 @@
+import itertools
 import logging
+import re
+import threading
+import weakref
 from collections.abc import Generator
 from contextlib import contextmanager
-from typing import Any
+from typing import Any, ClassVar
 
+import psycopg2.errors
+import psycopg2.extensions
+
+from app.core.config import settings
 from app.services.data.supabase_client import get_db_context
 
 logger = logging.getLogger(__name__)
 
+_QUERY_PARAM_RE = re.compile(r"%s")
+
+# Names of the statements already PREPAREd on each pooled connection. A value
+# of None marks a connection where PREPARE failed, or where a later EXECUTE
+# found no such statement (a transaction-mode pooler routed it to another
+# backend), so it keeps using plain SQL instead of retrying every checkout.
+_prepared_by_connection: "weakref.WeakKeyDictionary[Any, set[str] | None]" = (
+    weakref.WeakKeyDictionary()
+)
+_connection_state_lock = threading.Lock()
+
+# Pooled connections that already had their one-time setup (pgvector type
+# lookup, session settings). Each step costs a round trip, so run it once per
+# physical connection rather than on every checkout.
+_configured_connections: "weakref.WeakSet[Any]" = weakref.WeakSet()
+
+
+def _to_server_params(query: str) -> str:
+    """Rewrite psycopg2 %s placeholders as the $1..$n form PREPARE expects."""
+    counter = itertools.count(1)
+    return _QUERY_PARAM_RE.sub(lambda _match: f"${next(counter)}", query)
+
 
 class BaseManager:
     """Base class for database managers with connection pooling."""
 
+    # Hot-path statements to PREPARE once per pooled connection, by name.
+    PREPARED_STATEMENTS: ClassVar[dict[str, str]] = {}
+
     @contextmanager
     def get_db_context(self) -> Generator[tuple[Any, Any], None, None]:
         """Get database connection and cursor with automatic cleanup"""
         with get_db_context() as conn:
-            try:
-                from pgvector.psycopg2 import register_vector
-
-                register_vector(conn)
-            except ImportError:
-                logger.debug("pgvector is not installed; skipping vector registration")
-            except Exception as e:
-                logger.debug(f"Unable to register pgvector extension: {e!s}")
+            self._configure_connection(conn)
             cursor = conn.cursor()
             try:
+                self._prepare_statements(conn, cursor)
                 yield conn, cursor
             finally:
                 cursor.close()
+
+    @staticmethod
+    def _configure_connection(conn) -> None:
+        with _connection_state_lock:
+            if conn in _configured_connections:
+                return
+        try:
+            from pgvector.psycopg2 import register_vector
+
+            register_vector(conn)
+        except ImportError:
+            logger.debug("pgvector is not installed; skipping vector registration")
+        except Exception as e:
+            conn.rollback()
+            logger.debug(f"Unable to register pgvector extension: {e!s}")
+
+        session_settings = []
+        if settings.DB_HNSW_EF_SEARCH > 0:
+            session_settings.append(
+                f"SET hnsw.ef_search = {int(settings.DB_HNSW_EF_SEARCH)}"
+            )
+        if settings.DB_STATEMENT_TIMEOUT_MS > 0:
+            session_settings.append(
+                f"SET statement_timeout = {int(settings.DB_STATEMENT_TIMEOUT_MS)}"
+            )
+        if settings.DB_IDLE_IN_TRANSACTION_TIMEOUT_MS > 0:
+            timeout_ms = int(settings.DB_IDLE_IN_TRANSACTION_TIMEOUT_MS)
+            session_settings.append(
+                f"SET idle_in_transaction_session_timeout = {timeout_ms}"
+            )
+        if not settings.DB_JIT:
+            # Vector scans have high plan costs that trigger JIT compilation,
+            # which costs far more than it saves on these short queries.
+            session_settings.append("SET jit = off")
+
+        # Apply and commit each setting on its own so one rejected value does
+        # not roll back the others; a later rollback would undo uncommitted ones.
+        configured = True
+        cursor = conn.cursor()
+        try:
+            for statement in session_settings:
+                try:
+                    cursor.execute(statement)
+                    conn.commit()
+                except Exception as e:
+                    conn.rollback()
+                    configured = False
+                    logger.warning(f"Unable to apply '{statement}': {e!s}")
+        finally:
+            cursor.close()
+
+        # Leave a partly configured connection unmarked so the next checkout
+        # retries it.
+        if configured:
+            with _connection_state_lock:
+                _configured_connections.add(conn)
+
+    def _prepare_statements(self, conn, cursor) -> None:
+        if not settings.DB_PREPARED_STATEMENTS or not self.PREPARED_STATEMENTS:
+            return
+        with _connection_state_lock:
+            prepared = _prepared_by_connection.setdefault(conn, set())
+        if prepared is None:
+            return
+        missing = [name for name in self.PREPARED_STATEMENTS if name not in prepared]
+        if not missing:
+            return
+        try:
+            for name in missing:
+                query = _to_server_params(self.PREPARED_STATEMENTS[name])
+                cursor.execute(f"PREPARE {name} AS {query}")
+        except Exception as e:
+            conn.rollback()
+            with _connection_state_lock:
+                _prepared_by_connection[conn] = None
+            logger.debug(f"Unable to prepare statements; using plain SQL: {e!s}")
+            return
+        prepared.update(missing)
+
+    def _execute_prepared(self, cursor, name: str, params: tuple) -> None:
+        """Run a PREPARED_STATEMENTS entry, falling back to plain SQL."""
+        conn = getattr(cursor, "connection", None)
+        prepared = _prepared_by_connection.get(conn) if conn is not None else None
+        if prepared and name in prepared:
+            had_work = (
+                conn.get_transaction_status()
+                != psycopg2.extensions.TRANSACTION_STATUS_IDLE
+            )
+            placeholders = ", ".join(["%s"] * len(params))
+            try:
+                cursor.execute(f"EXECUTE {name} ({placeholders})", params)
+                return
+            except psycopg2.errors.InvalidSqlStatementName:
+                conn.rollback()
+                with _connection_state_lock:
+                    _prepared_by_connection[conn] = None
+                logger.warning(
+                    "Prepared statement %s is missing on this backend; "
+                    "using plain SQL on this connection",
+                    name,
+                )
+                # The rollback discarded earlier statements in this
+                # transaction, so only a lone EXECUTE can be safely rerun.
+                if had_work:
+                    raise
+        cursor.execute(self.PREPARED_STATEMENTS[name], params)
@@ -351,7 +351,7 @@ class ExperimentManager(BaseManager):
                 if row is None:
                     raise DatabaseError("Thread insertion returned no row")
 
-                thread = self._serialize_thread(dict(row))
+                thread = self._serialize_thread(row)
                 thread_id = thread["id"]
                 if normalized_context:
                     self._replace_context_recipes(
@@ -382,7 +382,7 @@ class ExperimentManager(BaseManager):
                 if row is None:
                     return None
 
-                thread = self._serialize_thread(dict(row))
+                thread = self._serialize_thread(row)
                 cursor.execute(
                     THREAD_CONTEXT_GET_SQL,
                     (
@@ -502,7 +502,7 @@ class ExperimentManager(BaseManager):
                     THREAD_TOUCH_SQL,
                     (thread_id, *self._owner_scope_params(viewer_user_id)),
                 )
-                return self._serialize_message(dict(row))
+                return self._serialize_message(row)
         except Exception as e:
             raise DatabaseError(f"Failed to create experiment message: {e!s}") from e
 
@@ -546,7 +546,7 @@ class ExperimentManager(BaseManager):
                 rows = cursor.fetchall()
                 threads: list[dict] = []
                 for row in rows:
-                    thread = self._serialize_thread(dict(row))
+                    thread = self._serialize_thread(row)
                     thread["last_message_role"] = row.get("last_message_role")
                     thread["last_message_content"] = row.get("last_message_content")
                     thread["last_message_created_at"] = row.get(
@@ -1,13 +1,17 @@
-import uuid
-from typing import Optional
+from typing import ClassVar, Optional
+
+from psycopg2.extras import execute_values
 
 from app.core.exceptions import DatabaseError
 
 from .base import BaseManager
 
-RECIPE_BOOK_WITH_COUNT_BY_ID_SQL = """
+FULL_RECIPE_BOOK_BY_ID_SQL = """
 SELECT rb.*,
-    COUNT(r.id)::int AS recipe_count
+    COALESCE(
+        json_agg(r.id ORDER BY rbr.added_at) FILTER (WHERE r.id IS NOT NULL),
+        '[]'::json
+    ) AS recipe_ids
 FROM recipe_books rb
 LEFT JOIN recipe_book_recipes rbr ON rbr.recipe_book_id = rb.id
 LEFT JOIN recipes r
@@ -16,9 +20,12 @@ LEFT JOIN recipes r
 WHERE rb.id = %s
 GROUP BY rb.id
 """
-RECIPE_BOOK_WITH_COUNT_BY_NAME_SQL = """
+FULL_RECIPE_BOOK_BY_NAME_SQL = """
 SELECT rb.*,
-    COUNT(r.id)::int AS recipe_count
+    COALESCE(
+        json_agg(r.id ORDER BY rbr.added_at) FILTER (WHERE r.id IS NOT NULL),
+        '[]'::json
+    ) AS recipe_ids
 FROM recipe_books rb
 LEFT JOIN recipe_book_recipes rbr ON rbr.recipe_book_id = rb.id
 LEFT JOIN recipes r
@@ -27,35 +34,19 @@ LEFT JOIN recipes r
 WHERE rb.normalized_name = %s
 GROUP BY rb.id
 """
+RECIPE_BOOK_BY_NAME_SQL = """
+SELECT *
+FROM recipe_books
+WHERE normalized_name = %s
+"""
 RECIPE_BOOKS_LIST_SQL = """
-SELECT rb.*,
-    COUNT(r.id)::int AS recipe_count
-FROM recipe_books rb
-LEFT JOIN recipe_book_recipes rbr ON rbr.recipe_book_id = rb.id
-LEFT JOIN recipes r
-    ON r.id = rbr.recipe_id
-    AND COALESCE(r.is_test_data, FALSE) = FALSE
-GROUP BY rb.id
-ORDER BY rb.created_at DESC
+SELECT *
+FROM recipe_books
+ORDER BY created_at DESC
 LIMIT %s
 """
-RECIPE_IDS_FOR_BOOK_SQL = """
-SELECT rbr.recipe_id
-FROM recipe_book_recipes rbr
-JOIN recipes r ON r.id = rbr.recipe_id
-WHERE rbr.recipe_book_id = %s
-  AND COALESCE(r.is_test_data, FALSE) = FALSE
-ORDER BY rbr.added_at ASC
-"""
 RECIPE_BOOKS_FOR_RECIPE_SQL = """
-SELECT rb.*,
-    (
-        SELECT COUNT(*)::int
-        FROM recipe_book_recipes rbr2
-        JOIN recipes r2 ON r2.id = rbr2.recipe_id
-        WHERE rbr2.recipe_book_id = rb.id
-          AND COALESCE(r2.is_test_data, FALSE) = FALSE
-    ) AS recipe_count
+SELECT rb.*
 FROM recipe_books rb
 JOIN recipe_book_recipes rbr ON rbr.recipe_book_id = rb.id
 JOIN recipes r ON r.id = rbr.recipe_id
@@ -64,19 +55,67 @@ WHERE rbr.recipe_id = %s
 ORDER BY rb.name ASC
 """
 INSERT_RECIPE_BOOK_SQL = """
-INSERT INTO recipe_books (id, name, normalized_name, description)
-VALUES (%s, %s, %s, %s)
+INSERT INTO recipe_books (name, normalized_name, description)
+VALUES (%s, %s, %s)
 ON CONFLICT (normalized_name) DO NOTHING
 RETURNING *
 """
-INSERT_RECIPE_BOOK_RECIPE_SQL = """
+ADD_RECIPE_TO_BOOK_SQL = """
+WITH book AS (
+    SELECT 1 FROM recipe_books WHERE id = %s
+),
+recipe AS (
+    SELECT 1
+    FROM recipes
+    WHERE id = %s
+      AND COALESCE(is_test_data, FALSE) = FALSE
+),
+inserted AS (
+    INSERT INTO recipe_book_recipes (recipe_book_id, recipe_id)
+    SELECT %s::uuid, %s::uuid
+    WHERE EXISTS (SELECT 1 FROM book) AND EXISTS (SELECT 1 FROM recipe)
+    ON CONFLICT (recipe_book_id, recipe_id) DO NOTHING
+    RETURNING 1
+)
+SELECT
+    EXISTS (SELECT 1 FROM book) AS book_exists,
+    EXISTS (SELECT 1 FROM recipe) AS recipe_exists,
+    EXISTS (SELECT 1 FROM inserted) AS added
+"""
+REMOVE_RECIPE_FROM_BOOK_SQL = """
+WITH book AS (
+    SELECT 1 FROM recipe_books WHERE id = %s
+),
+recipe AS (
+    SELECT 1
+    FROM recipes
+    WHERE id = %s
+      AND COALESCE(is_test_data, FALSE) = FALSE
+),
+deleted AS (
+    DELETE FROM recipe_book_recipes
+    WHERE recipe_book_id = %s
+      AND recipe_id = %s
+      AND EXISTS (SELECT 1 FROM book)
+      AND EXISTS (SELECT 1 FROM recipe)
+    RETURNING 1
+)
+SELECT
+    EXISTS (SELECT 1 FROM book) AS book_exists,
+    EXISTS (SELECT 1 FROM recipe) AS recipe_exists,
+    EXISTS (SELECT 1 FROM deleted) AS removed
+"""
+EXISTING_RECIPE_IDS_SQL = """
+SELECT id
+FROM recipes
+WHERE id = ANY(%s::uuid[])
+  AND COALESCE(is_test_data, FALSE) = FALSE
+"""
+INSERT_RECIPE_BOOK_RECIPES_SQL = """
 INSERT INTO recipe_book_recipes (recipe_book_id, recipe_id)
-VALUES (%s, %s)
+VALUES %s
 ON CONFLICT (recipe_book_id, recipe_id) DO NOTHING
-"""
-DELETE_RECIPE_BOOK_RECIPE_SQL = """
-DELETE FROM recipe_book_recipes
-WHERE recipe_book_id = %s AND recipe_id = %s
+RETURNING recipe_id
 """
 RECIPE_BOOK_EXISTS_SQL = "SELECT 1 FROM recipe_books WHERE id = %s"
 RECIPE_EXISTS_SQL = """
@@ -104,43 +143,50 @@ SELECT
 
 
 class RecipeBookManager(BaseManager):
-    @staticmethod
-    def _generate_id() -> str:
-        return str(uuid.uuid4())
+    PREPARED_STATEMENTS: ClassVar[dict[str, str]] = {
+        "full_recipe_book_by_id": FULL_RECIPE_BOOK_BY_ID_SQL,
+        "recipe_book_exists": RECIPE_BOOK_EXISTS_SQL,
+        "recipe_exists": RECIPE_EXISTS_SQL,
+        "add_recipe_to_book": ADD_RECIPE_TO_BOOK_SQL,
+        "remove_recipe_from_book": REMOVE_RECIPE_FROM_BOOK_SQL,
+    }
 
     @staticmethod
     def _to_dict(row) -> Optional[dict]:
-        return dict(row) if row else None
+        # Rows come from RealDictCursor and are already dicts; the data is
+        # trusted, so hand them to the response as-is instead of copying.
+        return row if row else None
 
     @staticmethod
-    def _normalize_name(name: str) -> str:
-        return " ".join(name.strip().split()).lower()
+    def _clean_name(name: str) -> str:
+        return " ".join(name.split())
 
-    def _fetch_recipe_book_by_id(self, cursor, recipe_book_id: str) -> Optional[dict]:
-        cursor.execute(RECIPE_BOOK_WITH_COUNT_BY_ID_SQL, (recipe_book_id,))
-        return self._to_dict(cursor.fetchone())
+    @classmethod
+    def _normalize_name(cls, name: str) -> str:
+        return cls._clean_name(name).lower()
 
-    def _fetch_recipe_book_by_name(self, cursor, name: str) -> Optional[dict]:
-        normalized_name = self._normalize_name(name)
-        cursor.execute(RECIPE_BOOK_WITH_COUNT_BY_NAME_SQL, (normalized_name,))
+    def _fetch_recipe_book_by_normalized_name(
+        self, cursor, normalized_name: str
+    ) -> Optional[dict]:
+        cursor.execute(RECIPE_BOOK_BY_NAME_SQL, (normalized_name,))
         return self._to_dict(cursor.fetchone())
 
     @staticmethod
-    def _fetch_recipe_ids_for_book(cursor, recipe_book_id: str) -> list[str]:
-        cursor.execute(RECIPE_IDS_FOR_BOOK_SQL, (recipe_book_id,))
-        rows = cursor.fetchall()
-        return [str(row["recipe_id"]) for row in rows]
+    def _to_full_recipe_book(row) -> Optional[dict]:
+        if not row:
+            return None
+        row["recipe_ids"] = [str(recipe_id) for recipe_id in row["recipe_ids"]]
+        return row
 
-    @staticmethod
-    def _record_exists(cursor, query: str, record_id: str) -> bool:
-        cursor.execute(query, (record_id,))
+    def _record_exists(self, cursor, statement: str, record_id: str) -> bool:
+        self._execute_prepared(cursor, statement, (record_id,))
         return cursor.fetchone() is not None
 
     def create_recipe_book(
         self, name: str, description: Optional[str] = None
     ) -> tuple[dict, bool]:
-        normalized_name = self._normalize_name(name)
-        clean_name = " ".join(name.strip().split())
+        clean_name = self._clean_name(name)
+        normalized_name = clean_name.lower()
         clean_description = description.strip() if description else None
         if clean_description == "":
             clean_description = None
@@ -149,22 +195,17 @@ class RecipeBookManager(BaseManager):
 
         try:
             with self.get_db_context() as (_conn, cursor):
-                recipe_book_id = self._generate_id()
                 cursor.execute(
                     INSERT_RECIPE_BOOK_SQL,
-                    (
-                        recipe_book_id,
-                        clean_name,
-                        normalized_name,
-                        clean_description,
-                    ),
+                    (clean_name, normalized_name, clean_description),
                 )
                 row = self._to_dict(cursor.fetchone())
                 if row:
-                    row["recipe_count"] = 0
                     return row, True
 
-                existing = self._fetch_recipe_book_by_name(cursor, clean_name)
+                existing = self._fetch_recipe_book_by_normalized_name(
+                    cursor, normalized_name
+                )
                 if existing:
                     return existing, False
 
@@ -177,29 +218,20 @@ class RecipeBookManager(BaseManager):
     def get_full_recipe_book_by_id(self, recipe_book_id: str) -> Optional[dict]:
         try:
             with self.get_db_context() as (_conn, cursor):
-                recipe_book = self._fetch_recipe_book_by_id(cursor, recipe_book_id)
-                if not recipe_book:
-                    return None
-                recipe_book["recipe_ids"] = self._fetch_recipe_ids_for_book(
-                    cursor, recipe_book_id
+                self._execute_prepared(
+                    cursor, "full_recipe_book_by_id", (recipe_book_id,)
                 )
-                recipe_book["recipe_count"] = len(recipe_book["recipe_ids"])
-                return recipe_book
+                return self._to_full_recipe_book(cursor.fetchone())
         except Exception as e:
             raise DatabaseError(f"Failed to get full recipe book: {e!s}") from e
 
     def get_full_recipe_book_by_name(self, name: str) -> Optional[dict]:
         try:
             with self.get_db_context() as (_conn, cursor):
-                recipe_book = self._fetch_recipe_book_by_name(cursor, name)
-                if not recipe_book:
-                    return None
-                recipe_book_id = str(recipe_book["id"])
-                recipe_book["recipe_ids"] = self._fetch_recipe_ids_for_book(
-                    cursor, recipe_book_id
+                cursor.execute(
+                    FULL_RECIPE_BOOK_BY_NAME_SQL, (self._normalize_name(name),)
                 )
-                recipe_book["recipe_count"] = len(recipe_book["recipe_ids"])
-                return recipe_book
+                return self._to_full_recipe_book(cursor.fetchone())
         except Exception as e:
             raise DatabaseError(f"Failed to get full recipe book by name: {e!s}") from e
 
@@ -207,74 +239,87 @@ class RecipeBookManager(BaseManager):
         try:
             with self.get_db_context() as (_conn, cursor):
                 cursor.execute(RECIPE_BOOKS_LIST_SQL, (limit,))
-                rows = cursor.fetchall()
-                return [dict(row) for row in rows]
+                return cursor.fetchall()
         except Exception as e:
             raise DatabaseError(f"Failed to list recipe books: {e!s}") from e
 
     def recipe_exists(self, recipe_id: str) -> bool:
         try:
             with self.get_db_context() as (_conn, cursor):
-                return self._record_exists(cursor, RECIPE_EXISTS_SQL, recipe_id)
+                return self._record_exists(cursor, "recipe_exists", recipe_id)
         except Exception as e:
             raise DatabaseError(f"Failed to verify recipe existence: {e!s}") from e
 
     def add_recipe_to_book(self, recipe_book_id: str, recipe_id: str) -> dict:
         try:
             with self.get_db_context() as (_conn, cursor):
-                book_exists = self._record_exists(
-                    cursor, RECIPE_BOOK_EXISTS_SQL, recipe_book_id
-                )
-                if not book_exists:
-                    return {"book_exists": False, "recipe_exists": True, "added": False}
-
-                recipe_exists = self._record_exists(
-                    cursor, RECIPE_EXISTS_SQL, recipe_id
-                )
-                if not recipe_exists:
-                    return {"book_exists": True, "recipe_exists": False, "added": False}
-
-                cursor.execute(
-                    INSERT_RECIPE_BOOK_RECIPE_SQL, (recipe_book_id, recipe_id)
+                self._execute_prepared(
+                    cursor,
+                    "add_recipe_to_book",
+                    (recipe_book_id, recipe_id, recipe_book_id, recipe_id),
                 )
+                row = cursor.fetchone()
                 return {
-                    "book_exists": True,
-                    "recipe_exists": True,
-                    "added": cursor.rowcount > 0,
+                    "book_exists": bool(row and row["book_exists"]),
+                    "recipe_exists": bool(row and row["recipe_exists"]),
+                    "added": bool(row and row["added"]),
                 }
         except Exception as e:
             raise DatabaseError(f"Failed to add recipe to recipe book: {e!s}") from e
 
-    def remove_recipe_from_book(self, recipe_book_id: str, recipe_id: str) -> dict:
+    def add_recipes_to_book(self, recipe_book_id: str, recipe_ids: list[str]) -> dict:
+        """Add many recipes to a book with one existence check and one insert."""
+        unique_recipe_ids = list(dict.fromkeys(recipe_ids))
         try:
             with self.get_db_context() as (_conn, cursor):
-                book_exists = self._record_exists(
-                    cursor, RECIPE_BOOK_EXISTS_SQL, recipe_book_id
-                )
-                if not book_exists:
+                if not self._record_exists(
+                    cursor, "recipe_book_exists", recipe_book_id
+                ):
                     return {
                         "book_exists": False,
-                        "recipe_exists": True,
-                        "removed": False,
+                        "added_recipe_ids": [],
+                        "missing_recipe_ids": [],
                     }
 
-                recipe_exists = self._record_exists(
-                    cursor, RECIPE_EXISTS_SQL, recipe_id
-                )
-                if not recipe_exists:
-                    return {
-                        "book_exists": True,
-                        "recipe_exists": False,
-                        "removed": False,
-                    }
+                cursor.execute(EXISTING_RECIPE_IDS_SQL, (unique_recipe_ids,))
+                existing_ids = {str(row["id"]) for row in cursor.fetchall()}
+                found_ids = [rid for rid in unique_recipe_ids if rid in existing_ids]
+                missing_ids = [
+                    rid for rid in unique_recipe_ids if rid not in existing_ids
+                ]
+
+                added_ids: set[str] = set()
+                if found_ids:
+                    rows = execute_values(
+                        cursor,
+                        INSERT_RECIPE_BOOK_RECIPES_SQL,
+                        [(recipe_book_id, rid) for rid in found_ids],
+                        template="(%s::uuid, %s::uuid)",
+                        fetch=True,
+                    )
+                    added_ids = {str(row["recipe_id"]) for row in rows}
 
-                cursor.execute(
-                    DELETE_RECIPE_BOOK_RECIPE_SQL, (recipe_book_id, recipe_id)
-                )
                 return {
                     "book_exists": True,
-                    "recipe_exists": True,
-                    "removed": cursor.rowcount > 0,
+                    "added_recipe_ids": [rid for rid in found_ids if rid in added_ids],
+                    "missing_recipe_ids": missing_ids,
+                }
+        except Exception as e:
+            raise DatabaseError(f"Failed to add recipes to recipe book: {e!s}") from e
+
+    def remove_recipe_from_book(self, recipe_book_id: str, recipe_id: str) -> dict:
+        try:
+            with self.get_db_context() as (_conn, cursor):
+                self._execute_prepared(
+                    cursor,
+                    "remove_recipe_from_book",
+                    (recipe_book_id, recipe_id, recipe_book_id, recipe_id),
+                )
+                row = cursor.fetchone()
+                return {
+                    "book_exists": bool(row and row["book_exists"]),
+                    "recipe_exists": bool(row and row["recipe_exists"]),
+                    "removed": bool(row and row["removed"]),
                 }
         except Exception as e:
             raise DatabaseError(
@@ -285,8 +330,7 @@ class RecipeBookManager(BaseManager):
         try:
             with self.get_db_context() as (_conn, cursor):
                 cursor.execute(RECIPE_BOOKS_FOR_RECIPE_SQL, (recipe_id,))
-                rows = cursor.fetchall()
-                return [dict(row) for row in rows]
+                return cursor.fetchall()
         except Exception as e:
             raise DatabaseError(f"Failed to get recipe books for recipe: {e!s}") from e
 
@@ -1,12 +1,57 @@
+import re
 import uuid
 from datetime import datetime
-from typing import Optional
+from typing import ClassVar, Optional
 
 from app.api.schemas import Recipe
+from app.core.cache import hash_cache_key, recipe_cache
+from app.core.config import settings
 from app.core.exceptions import DatabaseError
 
 from .base import BaseManager
 
+HNSW_DEFAULT_EF_SEARCH = 40
+# ingredient_text is an INCLUDE column of the unique (recipe_id, order_index)
+# index, and a btree entry tops out at about 2704 bytes.
+MAX_INGREDIENT_TEXT_BYTES = 2000
+_CANONICAL_UUID_RE = re.compile(
+    r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\Z"
+)
+
+CREATE_RECIPE_SQL = """
+WITH new_recipe AS (
+    INSERT INTO recipes (
+        title,
+        servings,
+        total_time,
+        source_url,
+        is_public,
+        created_by_user_id,
+        is_test_data
+    )
+    VALUES (%s, %s, %s, %s, %s, %s, %s)
+    RETURNING id
+),
+new_ingredients AS (
+    INSERT INTO recipe_ingredients (recipe_id, ingredient_text, order_index)
+    SELECT new_recipe.id, t.ingredient_text, t.ordinality - 1
+    FROM new_recipe,
+        unnest(%s::text[]) WITH ORDINALITY AS t(ingredient_text, ordinality)
+),
+new_instructions AS (
+    INSERT INTO recipe_instructions (recipe_id, instruction_text, step_number)
+    SELECT new_recipe.id, t.instruction_text, t.step_number
+    FROM new_recipe,
+        unnest(%s::text[]) WITH ORDINALITY AS t(instruction_text, step_number)
+),
+new_embedding AS (
+    INSERT INTO recipe_embeddings (recipe_id, embedding_type, embedding)
+    SELECT new_recipe.id, %s, %s::vector
+    FROM new_recipe
+    WHERE %s
+)
+SELECT id FROM new_recipe
+"""
 RECIPE_WITH_CHILDREN_SQL = """
 SELECT r.*,
     COALESCE(i.ingredients, ARRAY[]::text[]) AS ingredients,
@@ -26,34 +71,126 @@ WHERE r.id = %s
   AND (%s OR COALESCE(r.is_test_data, FALSE) = FALSE)
   AND (COALESCE(r.is_public, TRUE) = TRUE OR r.created_by_user_id = %s::uuid)
 """
-EMBEDDINGS_SELECT_SQL = """
-SELECT id, embedding_type, embedding, created_at
-FROM recipe_embeddings
-WHERE recipe_id = %s
-ORDER BY created_at
+RECIPE_WITH_CHILDREN_AND_EMBEDDINGS_SQL = """
+SELECT r.*,
+    COALESCE(i.ingredients, ARRAY[]::text[]) AS ingredients,
+    COALESCE(s.instructions, ARRAY[]::text[]) AS instructions,
+    COALESCE(emb.embeddings, '[]'::json) AS embeddings
+FROM recipes r
+LEFT JOIN LATERAL (
+    SELECT array_agg(ingredient_text ORDER BY order_index) AS ingredients
+    FROM recipe_ingredients
+    WHERE recipe_id = r.id
+) i ON true
+LEFT JOIN LATERAL (
+    SELECT array_agg(instruction_text ORDER BY step_number) AS instructions
+    FROM recipe_instructions
+    WHERE recipe_id = r.id
+) s ON true
+LEFT JOIN LATERAL (
+    SELECT json_agg(
+        json_build_object(
+            'id', id,
+            'embedding_type', embedding_type,
+            'embedding', embedding::real[],
+            'created_at', to_char(
+                created_at AT TIME ZONE 'UTC',
+                'YYYY-MM-DD"T"HH24:MI:SS.US"+00:00"'
+            )
+        )
+        ORDER BY created_at
+    ) AS embeddings
+    FROM recipe_embeddings
+    WHERE recipe_id = r.id
+) emb ON true
+WHERE r.id = %s
+  AND (%s OR COALESCE(r.is_test_data, FALSE) = FALSE)
+  AND (COALESCE(r.is_public, TRUE) = TRUE OR r.created_by_user_id = %s::uuid)
 """
 SIMILAR_RECIPES_BY_EMBEDDING_SQL = """
+WITH q AS (
+    SELECT %s::vector AS embedding
+)
+SELECT id, name, distance
+FROM (
+    SELECT
+        r.id::text AS id,
+        r.title AS name,
+        e.embedding <=> q.embedding AS distance
+    FROM q, recipe_embeddings e
+    JOIN recipes r ON r.id = e.recipe_id
+    WHERE e.embedding_type = %s
+      AND (%s OR COALESCE(r.is_test_data, FALSE) = FALSE)
+      AND (COALESCE(r.is_public, TRUE) = TRUE OR r.created_by_user_id = %s::uuid)
+    ORDER BY distance
+    LIMIT %s
+) nearest
+WHERE distance <= %s
+ORDER BY distance
+"""
+SIMILAR_RECIPES_BY_EMBEDDINGS_SQL = """
+SELECT q.query_index, nearest.id, nearest.name, nearest.distance
+FROM unnest(%s::vector[]) WITH ORDINALITY AS q(embedding, query_index)
+CROSS JOIN LATERAL (
+    SELECT
+        r.id::text AS id,
+        r.title AS name,
+        e.embedding <=> q.embedding AS distance
+    FROM recipe_embeddings e
+    JOIN recipes r ON r.id = e.recipe_id
+    WHERE e.embedding_type = %s
+      AND (%s OR COALESCE(r.is_test_data, FALSE) = FALSE)
+      AND (COALESCE(r.is_public, TRUE) = TRUE OR r.created_by_user_id = %s::uuid)
+    ORDER BY distance
+    LIMIT %s
+) nearest
+WHERE nearest.distance <= %s
+ORDER BY q.query_index, nearest.distance
+"""
+NEAREST_EMBEDDING_SQL = """
 SELECT
-    r.id AS recipe_id,
-    r.title AS recipe_name,
+    e.recipe_id,
+    e.embedding_type,
     e.embedding <=> %s::vector AS distance
 FROM recipe_embeddings e
 JOIN recipes r ON r.id = e.recipe_id
 WHERE e.embedding_type = %s
   AND (%s OR COALESCE(r.is_test_data, FALSE) = FALSE)
   AND (COALESCE(r.is_public, TRUE) = TRUE OR r.created_by_user_id = %s::uuid)
-  AND e.embedding <=> %s::vector <= %s
 ORDER BY distance
-LIMIT %s
+LIMIT 1
+"""
+NEAREST_EMBEDDINGS_SQL = """
+SELECT q.query_index, nearest.recipe_id, nearest.embedding_type, nearest.distance
+FROM unnest(%s::vector[]) WITH ORDINALITY AS q(embedding, query_index)
+CROSS JOIN LATERAL (
+    SELECT
+        e.recipe_id,
+        e.embedding_type,
+        e.embedding <=> q.embedding AS distance
+    FROM recipe_embeddings e
+    JOIN recipes r ON r.id = e.recipe_id
+    WHERE e.embedding_type = %s
+      AND (%s OR COALESCE(r.is_test_data, FALSE) = FALSE)
+      AND (COALESCE(r.is_public, TRUE) = TRUE OR r.created_by_user_id = %s::uuid)
+    ORDER BY distance
+    LIMIT 1
+) nearest
 """
 INGREDIENTS_FOR_RECIPES_SQL = """
-SELECT ri.recipe_id, ri.ingredient_text
-FROM recipe_ingredients ri
-JOIN recipes r ON r.id = ri.recipe_id
-WHERE ri.recipe_id = ANY(%s::uuid[])
+SELECT r.id AS recipe_id, i.ingredient_text
+FROM recipes r
+CROSS JOIN LATERAL (
+    SELECT ingredient_text, order_index
+    FROM recipe_ingredients
+    WHERE recipe_id = r.id
+    ORDER BY order_index
+    LIMIT %s
+) i
+WHERE r.id = ANY(%s::uuid[])
   AND (%s OR COALESCE(r.is_test_data, FALSE) = FALSE)
   AND (COALESCE(r.is_public, TRUE) = TRUE OR r.created_by_user_id = %s::uuid)
-ORDER BY ri.recipe_id, ri.order_index
+ORDER BY r.id, i.order_index
 """
 ALL_INGREDIENTS_FOR_RECIPES_SQL = """
 SELECT
@@ -121,105 +258,12 @@ LIMIT %s
 
 
 class RecipeManager(BaseManager):
-    @staticmethod
-    def _generate_id() -> str:
-        return str(uuid.uuid4())
-
-    @staticmethod
-    def _normalize_embedding_value(embedding_value):
-        if embedding_value is None:
-            return None
-        if hasattr(embedding_value, "tolist"):
-            return embedding_value.tolist()
-        try:
-            return list(embedding_value)
-        except TypeError:
-            return embedding_value
-
-    def _insert_recipe(
-        self,
-        cursor,
-        recipe_id: str,
-        title: str,
-        servings: Optional[str],
-        total_time: Optional[str],
-        is_test_data: bool = False,
-        source_url: Optional[str] = None,
-        is_public: bool = True,
-        created_by_user_id: str | None = None,
-    ) -> None:
-        sql = """
-        INSERT INTO recipes (
-            id,
-            title,
-            servings,
-            total_time,
-            source_url,
-            is_public,
-            created_by_user_id,
-            is_test_data
-        )
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-        """
-        cursor.execute(
-            sql,
-            (
-                recipe_id,
-                title,
-                servings,
-                total_time,
-                source_url,
-                is_public,
-                created_by_user_id,
-                is_test_data,
-            ),
-        )
-
-    def _insert_ingredients(
-        self, cursor, recipe_id: str, ingredients: list[str]
-    ) -> None:
-        sql = """
-        INSERT INTO recipe_ingredients (
-            id, recipe_id, ingredient_text, order_index
-        )
-        VALUES (%s, %s, %s, %s)
-        """
-        for index, ingredient_text in enumerate(ingredients):
-            ingredient_id = self._generate_id()
-            cursor.execute(
-                sql,
-                (ingredient_id, recipe_id, ingredient_text, index),
-            )
-
-    def _insert_instructions(
-        self, cursor, recipe_id: str, instructions: list[str]
-    ) -> None:
-        sql = """
-        INSERT INTO recipe_instructions (
-            id, recipe_id, instruction_text, step_number
-        )
-        VALUES (%s, %s, %s, %s)
-        """
-        for step_num, instruction_text in enumerate(instructions, 1):
-            instruction_id = self._generate_id()
-            cursor.execute(
-                sql,
-                (instruction_id, recipe_id, instruction_text, step_num),
-            )
-
-    def _insert_embedding(
-        self,
-        cursor,
-        recipe_id: str,
-        embedding_type: str,
-        embedding: list[float],
-    ) -> None:
-        sql = """
-        INSERT INTO recipe_embeddings (id, recipe_id, embedding_type, embedding)
-        VALUES (%s, %s, %s, %s)
-        """
-        embedding_id = self._generate_id()
-        cursor.execute(sql, (embedding_id, recipe_id, embedding_type, embedding))
+    PREPARED_STATEMENTS: ClassVar[dict[str, str]] = {
+        "recipe_with_children": RECIPE_WITH_CHILDREN_SQL,
+        "recipe_with_children_and_embeddings": RECIPE_WITH_CHILDREN_AND_EMBEDDINGS_SQL,
+    }
+    # The vector lookups stay unprepared: a generic plan cannot match the bound
+    # embedding_type against the partial per-type HNSW indexes.
 
     def _fetch_recipe_with_children(
         self,
@@ -227,36 +271,52 @@ class RecipeManager(BaseManager):
         recipe_id: str,
         include_test_data: bool = False,
         viewer_user_id: str | None = None,
+        with_embeddings: bool = False,
     ) -> Optional[dict]:
-        cursor.execute(
-            RECIPE_WITH_CHILDREN_SQL,
-            (recipe_id, include_test_data, viewer_user_id),
+        statement = (
+            "recipe_with_children_and_embeddings"
+            if with_embeddings
+            else "recipe_with_children"
+        )
+        self._execute_prepared(
+            cursor, statement, (recipe_id, include_test_data, viewer_user_id)
         )
         row = cursor.fetchone()
         if not row:
             return None
-        recipe_data = dict(row)
-        recipe_data["ingredients"] = list(recipe_data.get("ingredients") or [])
-        recipe_data["instructions"] = list(recipe_data.get("instructions") or [])
-        return recipe_data
+        row["ingredients"] = row.get("ingredients") or []
+        row["instructions"] = row.get("instructions") or []
+        if with_embeddings:
+            # JSON carries created_at as text; hand callers a datetime again.
+            for embedding in row.get("embeddings") or []:
+                embedding["created_at"] = datetime.fromisoformat(
+                    embedding["created_at"]
+                )
+        return row
 
-    def _fetch_embeddings(self, cursor, recipe_id: str) -> list[dict]:
-        cursor.execute(EMBEDDINGS_SELECT_SQL, (recipe_id,))
-        embeddings = [dict(row) for row in cursor.fetchall()]
-        for row in embeddings:
-            row["embedding"] = self._normalize_embedding_value(row.get("embedding"))
-        return embeddings
+    @staticmethod
+    def _normalize_recipe_ids(recipe_ids: list[str]) -> list[str]:
+        """Canonical, de-duplicated UUID strings; invalid ids are dropped."""
+        normalized_ids: dict[str, None] = {}
+        for recipe_id in recipe_ids:
+            candidate = str(recipe_id).lower()
+            # Most ids are already canonical; only parse the odd ones.
+            if not _CANONICAL_UUID_RE.match(candidate):
+                try:
+                    candidate = str(uuid.UUID(candidate))
+                except ValueError:
+                    continue
+            normalized_ids[candidate] = None
+        return list(normalized_ids)
 
     @staticmethod
-    def _format_semantic_search_row(row: dict) -> dict:
-        recipe_id = row.get("recipe_id")
-        distance_value = row.get("distance")
-        distance = float(distance_value) if distance_value is not None else None
-        return {
-            "id": str(recipe_id) if recipe_id is not None else None,
-            "name": row.get("recipe_name"),
-            "distance": distance,
-        }
+    def _vector_literals(embeddings: list[list[float]]) -> list[str]:
+        # psycopg2 sends nested lists as a 2-D numeric array, which has no
+        # cast to vector[]; send pgvector text literals instead.
+        return [
+            "[" + ",".join(str(value) for value in embedding) + "]"
+            for embedding in embeddings
+        ]
 
     def delete_recipe(self, recipe_id: str) -> bool:
         """Delete a recipe by ID"""
@@ -264,10 +324,15 @@ class RecipeManager(BaseManager):
             with self.get_db_context() as (_conn, cursor):
                 sql = "DELETE FROM recipes WHERE id = %s"
                 cursor.execute(sql, (recipe_id,))
-                return cursor.rowcount > 0
+                deleted = cursor.rowcount > 0
         except Exception as e:
             raise DatabaseError(f"Failed to delete recipe: {e!s}") from e
 
+        if deleted:
+            # Cache keys are hashed per viewer, so drop every cached recipe.
+            recipe_cache.clear()
+        return deleted
+
     def create_recipe_from_model(
         self,
         recipe: Recipe,
@@ -279,33 +344,35 @@ class RecipeManager(BaseManager):
         created_by_user_id: str | None = None,
     ) -> str:
         """Create recipe from a model with ingredients, instructions, and embeddings."""
-        recipe_id = self._generate_id()
+        for index, ingredient in enumerate(recipe.ingredients):
+            size = len(ingredient.encode("utf-8"))
+            if size > MAX_INGREDIENT_TEXT_BYTES:
+                raise DatabaseError(
+                    f"Failed to create recipe: ingredient {index + 1} is {size} "
+                    f"bytes, over the {MAX_INGREDIENT_TEXT_BYTES}-byte limit"
+                )
 
+        has_embedding = bool(embedding_type) and embedding is not None
         try:
             with self.get_db_context() as (_conn, cursor):
-                self._insert_recipe(
-                    cursor=cursor,
-                    recipe_id=recipe_id,
-                    title=recipe.title,
-                    servings=recipe.servings,
-                    total_time=recipe.total_time,
-                    source_url=source_url,
-                    is_public=is_public,
-                    created_by_user_id=created_by_user_id,
-                    is_test_data=is_test_data,
+                cursor.execute(
+                    CREATE_RECIPE_SQL,
+                    (
+                        recipe.title,
+                        recipe.servings,
+                        recipe.total_time,
+                        source_url,
+                        is_public,
+                        created_by_user_id,
+                        is_test_data,
+                        recipe.ingredients,
+                        recipe.instructions,
+                        embedding_type if has_embedding else None,
+                        embedding if has_embedding else None,
+                        has_embedding,
+                    ),
                 )
-                self._insert_ingredients(cursor, recipe_id, recipe.ingredients)
-                self._insert_instructions(cursor, recipe_id, recipe.instructions)
-
-                if embedding_type and embedding is not None:
-                    self._insert_embedding(
-                        cursor=cursor,
-                        recipe_id=recipe_id,
-                        embedding_type=embedding_type,
-                        embedding=embedding,
-                    )
-
-                return recipe_id
+                return str(cursor.fetchone()["id"])
 
         except Exception as e:
             raise DatabaseError(f"Failed to create recipe: {e!s}") from e
@@ -317,6 +384,16 @@ class RecipeManager(BaseManager):
         viewer_user_id: str | None = None,
     ) -> Optional[dict]:
         """Get a complete recipe with ingredients and instructions"""
+        cache_key = hash_cache_key(
+            "recipe",
+            str(recipe_id),
+            str(include_test_data),
+            viewer_user_id or "",
+        )
+        cached_recipe = recipe_cache.get(cache_key)
+        if cached_recipe is not None:
+            return cached_recipe
+
         try:
             with self.get_db_context() as (_conn, cursor):
                 recipe_data = self._fetch_recipe_with_children(
@@ -327,11 +404,13 @@ class RecipeManager(BaseManager):
                 )
                 if not recipe_data:
                     return None
-                return recipe_data
 
         except Exception as e:
             raise DatabaseError(f"Failed to get recipe: {e!s}") from e
 
+        recipe_cache.set(cache_key, recipe_data)
+        return recipe_data
+
     def get_full_recipe_with_embeddings(
         self,
         recipe_id: str,
@@ -346,11 +425,10 @@ class RecipeManager(BaseManager):
                     recipe_id=recipe_id,
                     include_test_data=include_test_data,
                     viewer_user_id=viewer_user_id,
+                    with_embeddings=True,
                 )
                 if not recipe_data:
                     return None
-
-                recipe_data["embeddings"] = self._fetch_embeddings(cursor, recipe_id)
                 return recipe_data
 
         except Exception as e:
@@ -384,7 +462,7 @@ class RecipeManager(BaseManager):
                         RECIPES_PAGE_SQL,
                         (include_test_data, viewer_user_id, query_limit),
                     )
-                return [dict(row) for row in cursor.fetchall()]
+                return cursor.fetchall()
         except Exception as e:
             raise DatabaseError(f"Failed to list recipes: {e!s}") from e
 
@@ -403,13 +481,7 @@ class RecipeManager(BaseManager):
         if not recipe_ids:
             return {}
 
-        normalized_ids: list[str] = []
-        for recipe_id in recipe_ids:
-            try:
-                normalized_ids.append(str(uuid.UUID(str(recipe_id))))
-            except (TypeError, ValueError):
-                continue
-
+        normalized_ids = self._normalize_recipe_ids(recipe_ids)
         if not normalized_ids:
             return {}
 
@@ -420,14 +492,11 @@ class RecipeManager(BaseManager):
             with self.get_db_context() as (_conn, cursor):
                 cursor.execute(
                     INGREDIENTS_FOR_RECIPES_SQL,
-                    (normalized_ids, include_test_data, viewer_user_id),
+                    (max_items, normalized_ids, include_test_data, viewer_user_id),
                 )
                 for row in cursor.fetchall():
                     recipe_id = str(row["recipe_id"])
-                    ingredient = row["ingredient_text"]
-                    bucket = previews.setdefault(recipe_id, [])
-                    if len(bucket) < max_items and ingredient is not None:
-                        bucket.append(ingredient)
+                    previews.setdefault(recipe_id, []).append(row["ingredient_text"])
             return previews
         except Exception as e:
             raise DatabaseError(f"Failed to get ingredient previews: {e!s}") from e
@@ -483,15 +552,7 @@ class RecipeManager(BaseManager):
         if not recipe_ids:
             return {}
 
-        normalized_ids: list[str] = []
-        for recipe_id in recipe_ids:
-            try:
-                normalized_id = str(uuid.UUID(str(recipe_id)))
-            except (TypeError, ValueError):
-                continue
-            if normalized_id not in normalized_ids:
-                normalized_ids.append(normalized_id)
-
+        normalized_ids = self._normalize_recipe_ids(recipe_ids)
         if not normalized_ids:
             return {}
 
@@ -504,9 +565,8 @@ class RecipeManager(BaseManager):
                 rows = cursor.fetchall()
                 ingredients_by_recipe: dict[str, list[str]] = {}
                 for row in rows:
-                    row_data = dict(row)
-                    ingredients_by_recipe[str(row_data["recipe_id"])] = list(
-                        row_data.get("ingredients") or []
+                    ingredients_by_recipe[str(row["recipe_id"])] = (
+                        row["ingredients"] or []
                     )
                 return ingredients_by_recipe
         except Exception as e:
@@ -524,6 +584,10 @@ class RecipeManager(BaseManager):
         """Find recipes with embeddings closest to the provided embedding."""
         try:
             with self.get_db_context() as (_conn, cursor):
+                # An HNSW scan yields at most ef_search rows (pgvector default
+                # 40), so widen it for this transaction when the limit needs it.
+                if limit > max(settings.DB_HNSW_EF_SEARCH, HNSW_DEFAULT_EF_SEARCH):
+                    cursor.execute("SET LOCAL hnsw.ef_search = %s", (limit,))
                 cursor.execute(
                     SIMILAR_RECIPES_BY_EMBEDDING_SQL,
                     (
@@ -531,15 +595,53 @@ class RecipeManager(BaseManager):
                         embedding_type,
                         include_test_data,
                         viewer_user_id,
-                        embedding,
+                        limit,
                         max_distance,
+                    ),
+                )
+                # Columns are already named and typed as the search results.
+                return cursor.fetchall()
+        except Exception as e:
+            raise DatabaseError(f"Failed to search recipes by embedding: {e!s}") from e
+
+    def search_recipes_by_embeddings(
+        self,
+        embeddings: list[list[float]],
+        embedding_type: str,
+        limit: int = 10,
+        max_distance: float = 0.35,
+        include_test_data: bool = False,
+        viewer_user_id: str | None = None,
+    ) -> list[list[dict]]:
+        """Run search_recipes_by_embedding for many query vectors in one query.
+
+        Returns one list of matches per input embedding, in input order.
+        """
+        if not embeddings:
+            return []
+        try:
+            with self.get_db_context() as (_conn, cursor):
+                if limit > max(settings.DB_HNSW_EF_SEARCH, HNSW_DEFAULT_EF_SEARCH):
+                    cursor.execute("SET LOCAL hnsw.ef_search = %s", (limit,))
+                cursor.execute(
+                    SIMILAR_RECIPES_BY_EMBEDDINGS_SQL,
+                    (
+                        self._vector_literals(embeddings),
+                        embedding_type,
+                        include_test_data,
+                        viewer_user_id,
                         limit,
+                        max_distance,
                     ),
                 )
                 rows = cursor.fetchall()
-                return [self._format_semantic_search_row(dict(row)) for row in rows]
         except Exception as e:
-            raise DatabaseError(f"Failed to search recipes by embedding: {e!s}") from e
+            raise DatabaseError(f"Failed to search recipes by embeddings: {e!s}") from e
+
+        results: list[list[dict]] = [[] for _ in embeddings]
+        for row in rows:
+            results[row.pop("query_index") - 1].append(row)
+        return results
 
     def find_nearest_embedding(
         self,
@@ -551,24 +653,44 @@ class RecipeManager(BaseManager):
         """Find the nearest embedding by cosine distance."""
         try:
             with self.get_db_context() as (_conn, cursor):
-                sql = """
-                SELECT
-                    e.recipe_id,
-                    e.embedding_type,
-                    e.embedding <=> %s::vector AS distance
-                FROM recipe_embeddings e
-                JOIN recipes r ON r.id = e.recipe_id
-                WHERE e.embedding_type = %s
-                  AND (%s OR COALESCE(r.is_test_data, FALSE) = FALSE)
-                  AND (COALESCE(r.is_public, TRUE) = TRUE OR r.created_by_user_id = %s::uuid)
-                ORDER BY distance
-                LIMIT 1
-                """
                 cursor.execute(
-                    sql,
+                    NEAREST_EMBEDDING_SQL,
                     (embedding, embedding_type, include_test_data, viewer_user_id),
                 )
                 row = cursor.fetchone()
-                return dict(row) if row else None
+                return row
         except Exception as e:
             raise DatabaseError(f"Failed to find nearest embedding: {e!s}") from e
+
+    def find_nearest_embeddings(
+        self,
+        embeddings: list[list[float]],
+        embedding_type: str,
+        include_test_data: bool = False,
+        viewer_user_id: str | None = None,
+    ) -> list[dict | None]:
+        """Run find_nearest_embedding for many query vectors in one query.
+
+        Returns one match (or None) per input embedding, in input order.
+        """
+        if not embeddings:
+            return []
+        try:
+            with self.get_db_context() as (_conn, cursor):
+                cursor.execute(
+                    NEAREST_EMBEDDINGS_SQL,
+                    (
+                        self._vector_literals(embeddings),
+                        embedding_type,
+                        include_test_data,
+                        viewer_user_id,
+                    ),
+                )
+                rows = cursor.fetchall()
+        except Exception as e:
+            raise DatabaseError(f"Failed to find nearest embeddings: {e!s}") from e
+
+        results: list[dict | None] = [None] * len(embeddings)
+        for row in rows:
+            results[row.pop("query_index") - 1] = row
+        return results
@@ -1,3 +1,4 @@
+import threading
 from collections.abc import Generator
 from contextlib import contextmanager
 from typing import Any, Optional
@@ -15,10 +16,18 @@ logger = get_logger(__name__)
 # Global connection pool
 _connection_pool: Optional[psycopg2.pool.ThreadedConnectionPool] = None
 
+# ThreadedConnectionPool raises as soon as every connection is checked out.
+# Worker threads outnumber connections, so make them wait for a free slot.
+_connection_slots: threading.BoundedSemaphore | None = None
+
+# Pool and slot semaphore each checked-out connection came from, by id(conn),
+# so it is returned to and releases those even if the pool was re-initialized.
+_checkouts: dict[int, tuple[Any, threading.BoundedSemaphore]] = {}
+
 
 def init_connection_pool() -> None:
     """Initialize the connection pool (idempotent)."""
-    global _connection_pool
+    global _connection_pool, _connection_slots
     if _connection_pool is not None:
         return
 
@@ -38,6 +47,13 @@ def init_connection_pool() -> None:
         "sslmode": settings.DB_SSLMODE,
         "cursor_factory": psycopg2.extras.RealDictCursor,
         "connect_timeout": 5,
+        "application_name": settings.DB_APPLICATION_NAME,
+        # Detect connections the pooler or a NAT dropped while idle in the
+        # pool, instead of hanging on them until the OS gives up.
+        "keepalives": 1,
+        "keepalives_idle": settings.DB_KEEPALIVES_IDLE,
+        "keepalives_interval": 10,
+        "keepalives_count": 3,
     }
 
     try:
@@ -46,6 +62,7 @@ def init_connection_pool() -> None:
             maxconn=settings.DB_POOL_MAXCONN,
             **conn_args,
         )
+        _connection_slots = threading.BoundedSemaphore(settings.DB_POOL_MAXCONN)
         logger.info("Database connection pool initialized")
     except Exception as e:
         logger.error(f"Failed to initialize connection pool: {e!s}")
@@ -56,31 +73,48 @@ def get_db_connection():
     """Get a connection from the pool (lazy init)."""
     if _connection_pool is None:
         init_connection_pool()
+    pool, slots = _connection_pool, _connection_slots
+    if not slots.acquire(timeout=settings.DB_POOL_TIMEOUT_SECONDS):
+        logger.error("Timed out waiting for a database connection")
+        raise ConnectionPoolError("Timed out waiting for a database connection")
     try:
-        return _connection_pool.getconn()
+        conn = pool.getconn()
     except Exception as e:
+        slots.release()
         logger.error(f"Failed to get connection from pool: {e!s}")
         raise ConnectionPoolError(f"Failed to get connection from pool: {e!s}") from e
+    _checkouts[id(conn)] = (pool, slots)
+    return conn
 
 
 def return_db_connection(conn) -> None:
-    """Return a connection to the pool."""
-    if _connection_pool and conn:
-        try:
-            _connection_pool.putconn(conn)
-        except Exception as e:
-            logger.warning(f"Failed to return connection to pool: {e!s}")
+    """Return a connection to the pool it was checked out from."""
+    if not conn:
+        return
+    checkout = _checkouts.pop(id(conn), None)
+    if checkout is None:
+        return
+    pool, slots = checkout
+    try:
+        # A closed pool has already closed its connections.
+        if pool is _connection_pool:
+            pool.putconn(conn)
+    except Exception as e:
+        logger.warning(f"Failed to return connection to pool: {e!s}")
+    finally:
+        slots.release()
 
 
 def close_connection_pool() -> None:
     """Close all connections in the pool."""
-    global _connection_pool
+    global _connection_pool, _connection_slots
     if _connection_pool:
         try:
             _connection_pool.closeall()
             logger.info("Connection pool closed")
         finally:
             _connection_pool = None
+            _connection_slots = None
 
 
 @contextmanager
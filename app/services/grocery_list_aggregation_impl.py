@@ -13,6 +13,7 @@ class GroceryListAggregationResult(BaseModel):
     ingredients: list[str] = Field(default_factory=list)
 
 
+_INGREDIENT_TOKEN_SPLIT_RE = re.compile(r"[^a-z0-9]+")
 _INGREDIENT_STOPWORDS = {
     "a",
     "an",
@@ -126,7 +127,7 @@ class GroceryListAggregationServiceImpl(GroceryListAggregationService):
     def _ingredient_tokens(cls, ingredient: str) -> set[str]:
         tokens = {
             cls._normalize_token(token)
-            for token in re.split(r"[^a-z0-9]+", ingredient.lower())
+            for token in _INGREDIENT_TOKEN_SPLIT_RE.split(ingredient.lower())
         }
         return {
             token
@@ -1,7 +1,9 @@
 import json
 import logging
+import threading
 import time
 from collections.abc import Iterator
+from functools import lru_cache
 from typing import Any, Callable, Optional, TypeVar, Union
 
 from app.core.cache import (
@@ -16,7 +18,7 @@ from openai.types.chat import (
     ChatCompletionUserMessageParam,
 )
 from openai.types.shared_params import ResponseFormatJSONSchema
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 
 from app.core.config import settings
 from app.core.tracing import log_span, start_trace_span
@@ -34,9 +36,16 @@ def _get_embeddings_model_name() -> str:
     return settings.EMBEDDINGS_MODEL_NAME
 
 
+_openai_client: OpenAI | None = None
+_openai_client_lock = threading.Lock()
+
+
 def _get_openai_client() -> OpenAI:
     """
-    Get an authenticated OpenAI client using OpenRouter.
+    Get the shared authenticated OpenAI client using OpenRouter.
+
+    The client is created once per process and reused so its HTTP connection
+    pool keeps connections to OpenRouter alive across calls.
 
     Returns:
         OpenAI client instance
@@ -44,12 +53,26 @@ def _get_openai_client() -> OpenAI:
     Raises:
         ValueError: If the API token is not set
     """
+    global _openai_client
     api_token: str = settings.OPEN_ROUTER_API_KEY
 
     if not api_token:
         raise ValueError("API token is not set.")
 
-    return OpenAI(base_url="https://openrouter.ai/api/v1", api_key=api_token)
+    if _openai_client is None:
+        with _openai_client_lock:
+            if _openai_client is None:
+                _openai_client = OpenAI(
+                    base_url="https://openrouter.ai/api/v1", api_key=api_token
+                )
+    return _openai_client
+
+
+@lru_cache(maxsize=32)
+def _schema_with_fingerprint(model_class: type[BaseModel]) -> tuple[dict, str]:
+    # Schema generation walks the whole model, so do it once per class.
+    schema = model_class.model_json_schema()
+    return schema, json.dumps(schema, sort_keys=True, separators=(",", ":"))
 
 
 def _is_rate_limit_error(exc: Exception) -> bool:
@@ -414,8 +437,7 @@ def make_llm_call_structured_output_generic(
                 raise ValueError("LLM model name is not set.")
             span_metadata["model"] = model_name
 
-            schema = model_class.model_json_schema()
-            schema_fingerprint = json.dumps(schema, sort_keys=True)
+            schema, schema_fingerprint = _schema_with_fingerprint(model_class)
             cache_key = hash_cache_key(
                 "llm_structured",
                 model_name,
@@ -578,30 +600,24 @@ def make_llm_call_structured_output_generic(
                     return None, error_msg
 
                 try:
-                    response_data = json.loads(content_text)
-                    result = model_class.model_validate(response_data)
-                    llm_structured_cache.set(cache_key, result.model_dump())
-                    log_span(
-                        span,
-                        output={
-                            "success": True,
-                            "attempt": attempt,
-                            **_assistant_output_payload(content_text),
-                            "content": content_text,
-                            "response": response_data,
-                        },
-                        metadata={"cache_hit": False},
-                        metrics=usage_metrics,
-                    )
-                    return result, None
-                except json.JSONDecodeError as e:
-                    error_msg = f"Failed to parse JSON response: {e}. Raw content: {content_text!r}"
+                    # Parse and validate in one pass inside pydantic-core.
+                    result = model_class.model_validate_json(content_text)
+                except ValidationError as e:
+                    if any(err["type"] == "json_invalid" for err in e.errors()):
+                        error_msg = (
+                            f"Failed to parse JSON response: {e}. "
+                            f"Raw content: {content_text!r}"
+                        )
+                        retry_reason = "JSON parse failure"
+                    else:
+                        error_msg = f"Failed to validate response data: {e}"
+                        retry_reason = "validation failure"
                     logger.error(error_msg)
                     last_error_msg = error_msg
                     if attempt < max_attempts:
                         logger.warning(
-                            "Retrying structured output after JSON parse failure "
-                            "(attempt %s/%s).",
+                            "Retrying structured output after %s (attempt %s/%s).",
+                            retry_reason,
                             attempt + 1,
                             max_attempts,
                         )
@@ -618,34 +634,22 @@ def make_llm_call_structured_output_generic(
                         metrics=usage_metrics,
                     )
                     return None, error_msg
-                except Exception as e:
-                    error_msg = f"Failed to validate response data: {e}"
-                    logger.error(error_msg)
-                    last_error_msg = error_msg
-                    if attempt < max_attempts:
-                        logger.warning(
-                            "Retrying structured output after validation failure "
-                            "(attempt %s/%s).",
-                            attempt + 1,
-                            max_attempts,
-                        )
-                        continue
-                    log_span(
-                        span,
-                        output={
-                            "success": False,
-                            "attempt": attempt,
-                            **_assistant_output_payload(
-                                json.dumps(
-                                    response_data, default=str, ensure_ascii=True
-                                )
-                            ),
-                            "response": response_data,
-                        },
-                        metadata={"cache_hit": False, "error": error_msg},
-                        metrics=usage_metrics,
-                    )
-                    return None, error_msg
+
+                response_data = result.model_dump()
+                llm_structured_cache.set(cache_key, response_data)
+                log_span(
+                    span,
+                    output={
+                        "success": True,
+                        "attempt": attempt,
+                        **_assistant_output_payload(content_text),
+                        "content": content_text,
+                        "response": response_data,
+                    },
+                    metadata={"cache_hit": False},
+                    metrics=usage_metrics,
+                )
+                return result, None
 
             final_error = last_error_msg or "Structured output failed without an error"
             log_span(
@@ -667,42 +671,76 @@ def make_llm_call_structured_output_generic(
 
 
 def make_embedding(text: str) -> list[float]:
+    return make_embeddings([text])[0]
+
+
+def make_embeddings(texts: list[str]) -> list[list[float]]:
+    """Embed several texts, sending every cache miss in one API request."""
+    if not texts:
+        return []
     model_name = _get_embeddings_model_name()
     if not model_name:
         raise ValueError("Embeddings model name is not set.")
 
-    cache_key = hash_cache_key("llm_embedding", model_name, text)
+    cache_keys = [hash_cache_key("llm_embedding", model_name, text) for text in texts]
+    # Keep the single-text span shape that existing trace queries rely on.
+    if len(texts) == 1:
+        span_input: dict[str, Any] = {"text": texts[0]}
+        span_metadata: dict[str, Any] = {"cache_key": cache_keys[0]}
+    else:
+        span_input = {"texts": texts}
+        span_metadata = {"cache_keys": cache_keys, "input_count": len(texts)}
     with start_trace_span(
         name="llm.embedding",
         span_type="llm",
-        input_data={"text": text},
+        input_data=span_input,
         metadata={
             "model": model_name,
-            "input_chars": len(text),
-            "cache_key": cache_key,
+            "input_chars": sum(len(text) for text in texts),
+            **span_metadata,
         },
     ) as span:
-        cached_embedding = embedding_cache.get(cache_key)
-        if cached_embedding is not None:
-            cached_copy = list(cached_embedding)
+        embeddings: list[list[float] | None] = []
+        missing: dict[str, list[int]] = {}
+        for index, (text, cache_key) in enumerate(zip(texts, cache_keys)):
+            cached_embedding = embedding_cache.get(cache_key)
+            if cached_embedding is not None:
+                embeddings.append(list(cached_embedding))
+                continue
+            embeddings.append(None)
+            missing.setdefault(text, []).append(index)
+
+        if not missing:
             log_span(
                 span,
-                output={"embedding_dimensions": len(cached_copy)},
+                output={"embedding_dimensions": len(embeddings[0])},
                 metadata={"cache_hit": True},
             )
-            return cached_copy
+            return embeddings
 
         client = _get_openai_client()
+        missing_texts = list(missing)
         response = _with_retries(
-            lambda: client.embeddings.create(model=model_name, input=text)
+            lambda: client.embeddings.create(model=model_name, input=missing_texts)
         )
-        embedding = list(response.data[0].embedding)
-        embedding_cache.set(cache_key, list(embedding))
+        data = sorted(response.data, key=lambda item: getattr(item, "index", 0))
+        if len(data) != len(missing_texts):
+            raise ValueError(
+                f"Embeddings API returned {len(data)} embeddings "
+                f"for {len(missing_texts)} inputs."
+            )
+        for text, item in zip(missing_texts, data, strict=True):
+            embedding = list(item.embedding)
+            indexes = missing[text]
+            embedding_cache.set(cache_keys[indexes[0]], list(embedding))
+            for index in indexes:
+                embeddings[index] = list(embedding)
+
         usage_metrics = _usage_to_metrics(getattr(response, "usage", None))
         log_span(
             span,
-            output={"embedding_dimensions": len(embedding)},
-            metadata={"cache_hit": False},
+            output={"embedding_dimensions": len(embeddings[0])},
+            metadata={"cache_hit": False, "cache_misses": len(missing_texts)},
             metrics=usage_metrics,
         )
-        return embedding
+        return embeddings
@@ -1,5 +1,6 @@
 import logging
 import re
+from functools import lru_cache
 from typing import Optional
 
 from app.core.prompts import RECIPE_EXTRACTION_SYSTEM_PROMPT
@@ -36,6 +37,15 @@ INGREDIENT_METADATA_PREFIXES = (
     "cook time",
     "yield",
 )
+BULLET_ITEM_RE = re.compile(r"^[-*]\s*(.+)$")
+NUMBERED_ITEM_RE = re.compile(r"^\d+[.)]\s*(.+)$")
+BULLET_LINE_RE = re.compile(r"^[-*]\s+\S")
+NUMBERED_LINE_RE = re.compile(r"^\d+[.)]\s+\S")
+
+
+@lru_cache(maxsize=16)
+def _scalar_field_re(label: str) -> re.Pattern[str]:
+    return re.compile(rf"(?im)^\s*{re.escape(label)}\s*:\s*(.+?)\s*$")
 
 
 def _normalize_lines(values: list[str]) -> list[str]:
@@ -46,10 +56,10 @@ def _clean_list_item(line: str) -> str:
     stripped = line.strip()
     if not stripped:
         return ""
-    bullet_item = re.match(r"^[-*]\s*(.+)$", stripped)
+    bullet_item = BULLET_ITEM_RE.match(stripped)
     if bullet_item:
         return bullet_item.group(1).strip()
-    numbered_item = re.match(r"^\d+[.)]\s*(.+)$", stripped)
+    numbered_item = NUMBERED_ITEM_RE.match(stripped)
     if numbered_item:
         return numbered_item.group(1).strip()
     return stripped
@@ -67,7 +77,7 @@ def _fallback_title(raw_text: str) -> str:
             break
         if any(lowered.startswith(prefix) for prefix in TITLE_SECTION_PREFIXES):
             continue
-        if re.match(r"^[-*]\s+\S", stripped) or re.match(r"^\d+[.)]\s+\S", stripped):
+        if BULLET_LINE_RE.match(stripped) or NUMBERED_LINE_RE.match(stripped):
             continue
         return stripped
     return ""
@@ -95,7 +105,7 @@ def _fallback_instructions(raw_text: str) -> list[str]:
         ):
             break
 
-        numbered_step = re.match(r"^\d+[.)]\s*(.+)$", stripped)
+        numbered_step = NUMBERED_ITEM_RE.match(stripped)
         if numbered_step:
             step = numbered_step.group(1).strip()
             if step:
@@ -140,10 +150,7 @@ def _fallback_ingredients(raw_text: str) -> list[str]:
 
 
 def _fallback_scalar_field(raw_text: str, label: str) -> str:
-    match = re.search(
-        rf"(?im)^\s*{re.escape(label)}\s*:\s*(.+?)\s*$",
-        raw_text,
-    )
+    match = _scalar_field_re(label).search(raw_text)
     if not match:
         return ""
     return match.group(1).strip()
@@ -158,7 +165,8 @@ def _fallback_recipe(raw_text: str) -> Optional[Recipe]:
     if not title or not ingredients or not instructions:
         return None
 
-    return Recipe(
+    # Every field is already a str / list[str], so skip re-validation.
+    return Recipe.model_construct(
         title=title,
         ingredients=ingredients,
         instructions=instructions,
@@ -227,7 +235,8 @@ class RecipeExtractorImpl:
         if not instructions:
             instructions = _fallback_instructions(raw_text)
 
-        normalized_recipe = Recipe(
+        # The LLM result was validated once already; only strings were trimmed.
+        normalized_recipe = Recipe.model_construct(
             title=title,
             ingredients=ingredients,
             instructions=instructions,
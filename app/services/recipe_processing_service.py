@@ -36,6 +36,8 @@ URL_FETCH_DOMAIN_ALLOWLIST = tuple(
 )
 URL_FETCH_REDIRECT_STATUS_CODES = frozenset({301, 302, 303, 307, 308})
 MAX_EXTRACTED_TEXT_CHARS = 25000
+MAX_FETCHED_HTML_CHARS = 2_000_000
+MIN_HTML_FAST_CLEANUP_CHARS = 100
 RECIPE_SECTION_LINE_RE = re.compile(
     r"(?im)^\s*ingredients\s*:.*^\s*(instructions|directions|method|steps)\s*:",
     re.MULTILINE | re.DOTALL,
@@ -297,21 +299,21 @@ class RecipeProcessingService:
                         )
                         return None
 
-                    response = client.get(validated_url)
-                    if response.status_code in URL_FETCH_REDIRECT_STATUS_CODES:
-                        location = response.headers.get("location")
-                        if not location:
-                            logger.error(
-                                "Redirect response missing Location header. url=%s status=%s",
-                                validated_url,
-                                response.status_code,
-                            )
-                            return None
-                        current_url = urljoin(validated_url, location)
-                        continue
-
-                    response.raise_for_status()
-                    return response.text
+                    with client.stream("GET", validated_url) as response:
+                        if response.status_code in URL_FETCH_REDIRECT_STATUS_CODES:
+                            location = response.headers.get("location")
+                            if not location:
+                                logger.error(
+                                    "Redirect response missing Location header. url=%s status=%s",
+                                    validated_url,
+                                    response.status_code,
+                                )
+                                return None
+                            current_url = urljoin(validated_url, location)
+                            continue
+
+                        response.raise_for_status()
+                        return self._read_capped_text(response, MAX_FETCHED_HTML_CHARS)
 
             logger.error(
                 "URL fetch exceeded redirect limit. url=%s max_redirects=%s",
@@ -333,6 +335,30 @@ class RecipeProcessingService:
             logger.error("URL fetch validation failed for %s: %s", source_url, e)
             return None
 
+    @staticmethod
+    def _read_capped_text(response: httpx.Response, max_chars: int) -> str:
+        """
+        Read a streamed response body, stopping once max_chars have arrived.
+
+        Pages far larger than a recipe are truncated instead of buffered whole;
+        downstream extraction only keeps MAX_EXTRACTED_TEXT_CHARS anyway.
+        """
+        parts: list[str] = []
+        received = 0
+        for chunk in response.iter_text():
+            remaining = max_chars - received
+            if len(chunk) > remaining:
+                parts.append(chunk[:remaining])
+                logger.warning(
+                    "URL fetch truncated at %s characters. url=%s",
+                    max_chars,
+                    response.url,
+                )
+                break
+            parts.append(chunk)
+            received += len(chunk)
+        return "".join(parts)
+
     def _validate_outbound_url(
         self, candidate_url: str
     ) -> tuple[Optional[str], Optional[str]]:
@@ -477,6 +503,10 @@ class RecipeProcessingService:
         if self._looks_like_structured_recipe_text(normalized_input):
             logger.info("Skipping LLM cleanup for structured recipe-style input.")
             return normalized_input
+        visible_text = self._html_visible_recipe_text(normalized_input)
+        if visible_text:
+            logger.info("Skipping LLM cleanup for HTML with structured recipe text.")
+            return visible_text
 
         try:
             cleaned_text = self.cleanup_service.cleanup_input(normalized_input)
@@ -489,6 +519,23 @@ class RecipeProcessingService:
             logger.error(f"Input cleanup failed: {e}")
             return None
 
+    def _html_visible_recipe_text(self, raw_input: str) -> str | None:
+        """
+        Strip markup locally when the visible text is already a structured recipe.
+
+        Returns None when the input isn't HTML or still needs LLM cleanup.
+        """
+        if not HTML_TAG_RE.search(raw_input):
+            return None
+        visible_text = self._extract_relevant_content(
+            raw_input, max_chars=len(raw_input)
+        )
+        if len(visible_text) < MIN_HTML_FAST_CLEANUP_CHARS:
+            return None
+        if not self._looks_like_structured_recipe_text(visible_text):
+            return None
+        return visible_text
+
     @staticmethod
     def _looks_like_structured_recipe_text(raw_input: str) -> bool:
         # Avoid skipping cleanup for raw HTML payloads.
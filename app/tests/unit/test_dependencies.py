@@ -0,0 +1,20 @@
+from app.core import dependencies
+
+
+def test_service_providers_return_shared_instances() -> None:
+    providers = (
+        dependencies.get_recipe_manager,
+        dependencies.get_recipe_book_manager,
+        dependencies.get_recipe_processing_service,
+        dependencies.get_experiment_service,
+    )
+
+    for provider in providers:
+        assert provider() is provider()
+
+
+def test_experiment_service_reuses_shared_managers() -> None:
+    service = dependencies.get_experiment_service()
+
+    assert service.experiment_manager is dependencies.get_experiment_manager()
+    assert service.recipe_manager is dependencies.get_recipe_manager()
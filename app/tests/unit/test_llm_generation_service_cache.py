@@ -2,6 +2,8 @@ from contextlib import contextmanager
 from types import SimpleNamespace
 from uuid import uuid4
 
+import pytest
+
 from app.core.cache import TTLCache
 from app.services import llm_generation_service
 
@@ -191,3 +193,111 @@ def test_make_embedding_uses_cache_and_returns_copy(monkeypatch) -> None:
 
     assert second == [0.12, 0.34, 0.56]
     assert fake_embeddings.calls == 1
+
+
+def test_make_embeddings_requests_only_uncached_texts_once(monkeypatch) -> None:
+    requests: list[list[str]] = []
+
+    def _create(*, model, input):
+        requests.append(input)
+        return SimpleNamespace(
+            data=[
+                SimpleNamespace(index=index, embedding=[float(len(text))])
+                for index, text in enumerate(input)
+            ],
+            usage=None,
+        )
+
+    fake_client = SimpleNamespace(embeddings=SimpleNamespace(create=_create))
+    cache = TTLCache[list[float]](ttl_seconds=60, max_items=10)
+
+    monkeypatch.setattr(
+        llm_generation_service, "_get_embeddings_model_name", lambda: "test-embedding"
+    )
+    monkeypatch.setattr(
+        llm_generation_service, "_get_openai_client", lambda: fake_client
+    )
+    monkeypatch.setattr(llm_generation_service, "embedding_cache", cache)
+
+    llm_generation_service.make_embedding("egg")
+    embeddings = llm_generation_service.make_embeddings(
+        ["flour", "egg", "milk", "flour"]
+    )
+
+    assert embeddings == [[5.0], [3.0], [4.0], [5.0]]
+    assert requests == [["egg"], ["flour", "milk"]]
+
+
+def test_make_embeddings_raises_when_api_returns_too_few_embeddings(
+    monkeypatch,
+) -> None:
+    fake_embeddings = _FakeEmbeddings()
+    fake_client = SimpleNamespace(embeddings=fake_embeddings)
+
+    monkeypatch.setattr(
+        llm_generation_service, "_get_embeddings_model_name", lambda: "test-embedding"
+    )
+    monkeypatch.setattr(
+        llm_generation_service, "_get_openai_client", lambda: fake_client
+    )
+    monkeypatch.setattr(
+        llm_generation_service,
+        "embedding_cache",
+        TTLCache[list[float]](ttl_seconds=60, max_items=10),
+    )
+
+    with pytest.raises(ValueError, match="1 embeddings for 2 inputs"):
+        llm_generation_service.make_embeddings(["flour", "milk"])
+
+
+def test_make_embedding_keeps_single_text_span_shape(monkeypatch) -> None:
+    spans: list[dict] = []
+
+    @contextmanager
+    def _fake_start_trace_span(**kwargs):
+        spans.append(kwargs)
+        yield None
+
+    monkeypatch.setattr(
+        llm_generation_service, "_get_embeddings_model_name", lambda: "test-embedding"
+    )
+    monkeypatch.setattr(
+        llm_generation_service,
+        "_get_openai_client",
+        lambda: SimpleNamespace(embeddings=_FakeEmbeddings()),
+    )
+    monkeypatch.setattr(
+        llm_generation_service,
+        "embedding_cache",
+        TTLCache[list[float]](ttl_seconds=60, max_items=10),
+    )
+    monkeypatch.setattr(
+        llm_generation_service, "start_trace_span", _fake_start_trace_span
+    )
+    monkeypatch.setattr(llm_generation_service, "log_span", lambda *_a, **_k: None)
+
+    llm_generation_service.make_embedding("egg")
+
+    assert spans[0]["input_data"] == {"text": "egg"}
+    assert set(spans[0]["metadata"]) == {"model", "input_chars", "cache_key"}
+
+
+def test_get_openai_client_reuses_single_client(monkeypatch) -> None:
+    created: list[dict] = []
+
+    def _fake_openai(**kwargs):
+        created.append(kwargs)
+        return SimpleNamespace(**kwargs)
+
+    monkeypatch.setattr(llm_generation_service, "OpenAI", _fake_openai)
+    monkeypatch.setattr(llm_generation_service, "_openai_client", None)
+    monkeypatch.setattr(
+        llm_generation_service.settings, "OPEN_ROUTER_API_KEY", "test-key"
+    )
+
+    first = llm_generation_service._get_openai_client()
+    second = llm_generation_service._get_openai_client()
+
+    assert first is second
+    assert len(created) == 1
+    assert created[0]["api_key"] == "test-key"
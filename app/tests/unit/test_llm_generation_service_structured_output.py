@@ -187,6 +187,40 @@ def test_structured_output_returns_error_after_retry_exhaustion(monkeypatch) ->
     assert fake_completions.calls == 2
 
 
+def test_structured_output_reports_schema_mismatch_as_validation_error(
+    monkeypatch,
+) -> None:
+    fake_completions = _SequenceStructuredCompletions(
+        responses=[{"content": '{"ingredients": "1 tomato"}', "finish_reason": "stop"}]
+    )
+    fake_client = SimpleNamespace(chat=SimpleNamespace(completions=fake_completions))
+    cache = TTLCache[dict](ttl_seconds=60, max_items=10)
+
+    monkeypatch.setattr(llm_generation_service, "_get_chat_model_name", lambda: "test")
+    monkeypatch.setattr(
+        llm_generation_service, "_get_openai_client", lambda: fake_client
+    )
+    monkeypatch.setattr(llm_generation_service, "llm_structured_cache", cache)
+    monkeypatch.setattr(
+        llm_generation_service.settings,
+        "LLM_STRUCTURED_OUTPUT_MAX_ATTEMPTS",
+        1,
+    )
+
+    suffix = uuid4().hex
+    result, error = llm_generation_service.make_llm_call_structured_output_generic(
+        user_prompt=f"user-prompt-{suffix}",
+        system_prompt=f"system-prompt-{suffix}",
+        model_class=_StructuredResponseModel,
+        schema_name="structured_output_validation_failure_test",
+    )
+
+    assert result is None
+    assert error is not None
+    assert error.startswith("Failed to validate response data")
+    assert fake_completions.calls == 1
+
+
 def test_structured_output_logs_assistant_message_payload(monkeypatch) -> None:
     fake_completions = _SequenceStructuredCompletions(
         responses=[{"content": '{"ingredients":["1 tomato"]}', "finish_reason": "stop"}]
@@ -296,3 +330,24 @@ def test_structured_output_accepts_function_arguments_when_content_missing(
     assert result is not None
     assert result.ingredients == ["1 tomato"]
     assert fake_completions.calls == 1
+
+
+def test_schema_fingerprint_is_computed_once_per_model_class(monkeypatch) -> None:
+    class _CountingModel(BaseModel):
+        name: str
+
+    calls = []
+    original = _CountingModel.model_json_schema
+
+    def counting_schema(*args, **kwargs):
+        calls.append(1)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(_CountingModel, "model_json_schema", counting_schema)
+
+    first = llm_generation_service._schema_with_fingerprint(_CountingModel)
+    second = llm_generation_service._schema_with_fingerprint(_CountingModel)
+
+    assert first is second
+    assert len(calls) == 1
+    assert first[1].startswith('{"properties":{"name":')
@@ -16,3 +16,13 @@ def test_cleanup_prompt_supports_both_unit_guidance() -> None:
 
     assert "Fahrenheit and Celsius" in prompt
     assert "350°F / 180°C" in prompt
+
+
+def test_system_prompts_are_compacted() -> None:
+    for prompt in (
+        prompts.RECIPE_EXTRACTION_SYSTEM_PROMPT,
+        prompts.build_cleanup_system_prompt(unit_system="us"),
+    ):
+        assert prompt == prompt.strip()
+        assert "\n\n\n" not in prompt
+        assert all(line == line.rstrip() for line in prompt.splitlines())
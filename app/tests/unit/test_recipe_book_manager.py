@@ -1,6 +1,16 @@
+import uuid
 from contextlib import contextmanager
 
-from app.services.data.managers.recipe_book_manager import RecipeBookManager
+import psycopg2.errors
+import psycopg2.extensions
+
+import app.services.data.managers.recipe_book_manager as recipe_book_manager_module
+from app.core.config import settings
+from app.services.data.managers.recipe_book_manager import (
+    FULL_RECIPE_BOOK_BY_ID_SQL,
+    RECIPE_EXISTS_SQL,
+    RecipeBookManager,
+)
 
 
 class FakeCursor:
@@ -53,6 +63,7 @@ def test_create_recipe_book_inserts_normalized_name(monkeypatch) -> None:
                 "name": "Italian Recipes",
                 "normalized_name": "italian recipes",
                 "description": "Classic dishes",
+                "recipe_count": 0,
             }
         ]
     )
@@ -68,8 +79,7 @@ def test_create_recipe_book_inserts_normalized_name(monkeypatch) -> None:
     assert recipe_book["recipe_count"] == 0
 
     _, params = cursor.executed[0]
-    assert params[1] == "Italian Recipes"
-    assert params[2] == "italian recipes"
+    assert params == ("Italian Recipes", "italian recipes", "Classic dishes")
 
 
 def test_create_recipe_book_returns_existing_on_conflict(monkeypatch) -> None:
@@ -97,7 +107,9 @@ def test_create_recipe_book_returns_existing_on_conflict(monkeypatch) -> None:
 
 def test_add_recipe_to_book_returns_missing_book(monkeypatch) -> None:
     manager = RecipeBookManager()
-    cursor = FakeCursor(fetchone_results=[None])
+    cursor = FakeCursor(
+        fetchone_results=[{"book_exists": False, "recipe_exists": True, "added": False}]
+    )
     _patch_db_context(monkeypatch, manager, cursor)
 
     result = manager.add_recipe_to_book("book-1", "recipe-1")
@@ -107,7 +119,9 @@ def test_add_recipe_to_book_returns_missing_book(monkeypatch) -> None:
 
 def test_add_recipe_to_book_returns_missing_recipe(monkeypatch) -> None:
     manager = RecipeBookManager()
-    cursor = FakeCursor(fetchone_results=[{"exists": 1}, None])
+    cursor = FakeCursor(
+        fetchone_results=[{"book_exists": True, "recipe_exists": False, "added": False}]
+    )
     _patch_db_context(monkeypatch, manager, cursor)
 
     result = manager.add_recipe_to_book("book-1", "recipe-1")
@@ -118,33 +132,83 @@ def test_add_recipe_to_book_returns_missing_recipe(monkeypatch) -> None:
 def test_add_recipe_to_book_returns_added_flag(monkeypatch) -> None:
     manager = RecipeBookManager()
     cursor = FakeCursor(
-        fetchone_results=[{"exists": 1}, {"exists": 1}],
-        rowcount_sequence=[0, 0, 1],
+        fetchone_results=[{"book_exists": True, "recipe_exists": True, "added": True}]
     )
     _patch_db_context(monkeypatch, manager, cursor)
 
     result = manager.add_recipe_to_book("book-1", "recipe-1")
 
     assert result == {"book_exists": True, "recipe_exists": True, "added": True}
+    assert len(cursor.executed) == 1
+    _, params = cursor.executed[0]
+    assert params == ("book-1", "recipe-1", "book-1", "recipe-1")
+
+
+def test_add_recipes_to_book_inserts_found_ids_in_one_batch(monkeypatch) -> None:
+    manager = RecipeBookManager()
+    cursor = FakeCursor(
+        fetchone_results=[{"?column?": 1}],
+        fetchall_results=[[{"id": "recipe-1"}, {"id": "recipe-3"}]],
+    )
+    _patch_db_context(monkeypatch, manager, cursor)
+    batches = []
+
+    def fake_execute_values(cur, query, rows, template=None, fetch=False):
+        batches.append(rows)
+        return [{"recipe_id": "recipe-3"}]
+
+    monkeypatch.setattr(
+        recipe_book_manager_module, "execute_values", fake_execute_values
+    )
+
+    result = manager.add_recipes_to_book(
+        "book-1", ["recipe-1", "recipe-2", "recipe-3", "recipe-1"]
+    )
+
+    assert result == {
+        "book_exists": True,
+        "added_recipe_ids": ["recipe-3"],
+        "missing_recipe_ids": ["recipe-2"],
+    }
+    assert batches == [[("book-1", "recipe-1"), ("book-1", "recipe-3")]]
+    _, lookup_params = cursor.executed[1]
+    assert lookup_params == (["recipe-1", "recipe-2", "recipe-3"],)
+
+
+def test_add_recipes_to_book_returns_missing_book(monkeypatch) -> None:
+    manager = RecipeBookManager()
+    cursor = FakeCursor(fetchone_results=[None])
+    _patch_db_context(monkeypatch, manager, cursor)
+
+    result = manager.add_recipes_to_book("book-1", ["recipe-1"])
+
+    assert result == {
+        "book_exists": False,
+        "added_recipe_ids": [],
+        "missing_recipe_ids": [],
+    }
+    assert len(cursor.executed) == 1
 
 
 def test_remove_recipe_from_book_returns_removed_flag(monkeypatch) -> None:
     manager = RecipeBookManager()
     cursor = FakeCursor(
-        fetchone_results=[{"exists": 1}, {"exists": 1}],
-        rowcount_sequence=[0, 0, 1],
+        fetchone_results=[{"book_exists": True, "recipe_exists": True, "removed": True}]
     )
     _patch_db_context(monkeypatch, manager, cursor)
 
     result = manager.remove_recipe_from_book("book-1", "recipe-1")
 
     assert result == {"book_exists": True, "recipe_exists": True, "removed": True}
+    assert len(cursor.executed) == 1
 
 
 def test_remove_recipe_from_book_returns_missing_recipe(monkeypatch) -> None:
     manager = RecipeBookManager()
     cursor = FakeCursor(
-        fetchone_results=[{"exists": 1}, None], rowcount_sequence=[0, 0]
+        fetchone_results=[
+            {"book_exists": True, "recipe_exists": False, "removed": False}
+        ]
     )
     _patch_db_context(monkeypatch, manager, cursor)
 
@@ -156,8 +220,9 @@ def test_remove_recipe_from_book_returns_missing_recipe(monkeypatch) -> None:
 def test_remove_recipe_from_book_returns_not_member(monkeypatch) -> None:
     manager = RecipeBookManager()
     cursor = FakeCursor(
-        fetchone_results=[{"exists": 1}, {"exists": 1}],
-        rowcount_sequence=[0, 0, 0],
+        fetchone_results=[
+            {"book_exists": True, "recipe_exists": True, "removed": False}
+        ]
     )
     _patch_db_context(monkeypatch, manager, cursor)
 
@@ -166,6 +231,38 @@ def test_remove_recipe_from_book_returns_not_member(monkeypatch) -> None:
     assert result == {"book_exists": True, "recipe_exists": True, "removed": False}
 
 
+def test_get_full_recipe_book_by_id_fetches_ids_in_one_query(monkeypatch) -> None:
+    manager = RecipeBookManager()
+    recipe_id = uuid.UUID("11111111-1111-1111-1111-111111111111")
+    cursor = FakeCursor(
+        fetchone_results=[
+            {
+                "id": "book-1",
+                "name": "Italian Recipes",
+                "recipe_count": 1,
+                "recipe_ids": [recipe_id],
+            }
+        ]
+    )
+    _patch_db_context(monkeypatch, manager, cursor)
+
+    recipe_book = manager.get_full_recipe_book_by_id("book-1")
+
+    assert recipe_book["recipe_ids"] == [str(recipe_id)]
+    assert recipe_book["recipe_count"] == 1
+    assert cursor.executed == [(FULL_RECIPE_BOOK_BY_ID_SQL, ("book-1",))]
+
+
+def test_get_full_recipe_book_by_name_returns_none_when_missing(monkeypatch) -> None:
+    manager = RecipeBookManager()
+    cursor = FakeCursor(fetchone_results=[None])
+    _patch_db_context(monkeypatch, manager, cursor)
+
+    assert manager.get_full_recipe_book_by_name("  Italian  Recipes ") is None
+    _, params = cursor.executed[0]
+    assert params == ("italian recipes",)
+
+
 def test_get_recipe_book_stats_computes_average(monkeypatch) -> None:
     manager = RecipeBookManager()
     cursor = FakeCursor(
@@ -203,3 +300,90 @@ def test_get_recipe_book_stats_handles_zero_books(monkeypatch) -> None:
     stats = manager.get_recipe_book_stats()
 
     assert stats["avg_recipes_per_book"] == 0.0
+
+
+class FakeConnection:
+    def __init__(self) -> None:
+        self.rollbacks = 0
+
+    def rollback(self) -> None:
+        self.rollbacks += 1
+
+    def get_transaction_status(self) -> int:
+        return psycopg2.extensions.TRANSACTION_STATUS_IDLE
+
+
+def test_recipe_exists_executes_statement_prepared_on_connection(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "DB_PREPARED_STATEMENTS", True)
+    manager = RecipeBookManager()
+    conn = FakeConnection()
+    cursor = FakeCursor(fetchone_results=[{"?column?": 1}])
+    cursor.connection = conn
+    _patch_db_context(monkeypatch, manager, cursor)
+
+    manager._prepare_statements(conn, cursor)
+    manager._prepare_statements(conn, cursor)
+    exists = manager.recipe_exists("recipe-1")
+
+    assert exists is True
+    prepares = [query for query, _ in cursor.executed if query.startswith("PREPARE")]
+    assert len(prepares) == len(RecipeBookManager.PREPARED_STATEMENTS)
+    assert "$1" in prepares[0] and "%s" not in prepares[0]
+    assert cursor.executed[-1] == ("EXECUTE recipe_exists (%s)", ("recipe-1",))
+
+
+def test_recipe_exists_falls_back_to_plain_sql_when_prepare_fails(
+    monkeypatch,
+) -> None:
+    monkeypatch.setattr(settings, "DB_PREPARED_STATEMENTS", True)
+    manager = RecipeBookManager()
+    conn = FakeConnection()
+
+    class RejectingPrepareCursor(FakeCursor):
+        def execute(self, query, params=None):
+            if query.startswith("PREPARE"):
+                raise RuntimeError("prepared statements are not supported")
+            super().execute(query, params)
+
+    cursor = RejectingPrepareCursor(fetchone_results=[None])
+    cursor.connection = conn
+    _patch_db_context(monkeypatch, manager, cursor)
+
+    manager._prepare_statements(conn, cursor)
+    manager._prepare_statements(conn, cursor)
+    exists = manager.recipe_exists("recipe-1")
+
+    assert exists is False
+    assert conn.rollbacks == 1
+    assert cursor.executed == [(RECIPE_EXISTS_SQL, ("recipe-1",))]
+
+
+def test_recipe_exists_falls_back_to_plain_sql_when_execute_finds_no_statement(
+    monkeypatch,
+) -> None:
+    monkeypatch.setattr(settings, "DB_PREPARED_STATEMENTS", True)
+    manager = RecipeBookManager()
+    conn = FakeConnection()
+
+    class OtherBackendCursor(FakeCursor):
+        def execute(self, query, params=None):
+            if query.startswith("EXECUTE"):
+                raise psycopg2.errors.InvalidSqlStatementName(
+                    'prepared statement "recipe_exists" does not exist'
+                )
+            super().execute(query, params)
+
+    cursor = OtherBackendCursor(fetchone_results=[{"?column?": 1}, None])
+    cursor.connection = conn
+    _patch_db_context(monkeypatch, manager, cursor)
+
+    manager._prepare_statements(conn, cursor)
+    first = manager.recipe_exists("recipe-1")
+    second = manager.recipe_exists("recipe-2")
+
+    assert (first, second) == (True, False)
+    assert conn.rollbacks == 1
+    assert cursor.executed[-2:] == [
+        (RECIPE_EXISTS_SQL, ("recipe-1",)),
+        (RECIPE_EXISTS_SQL, ("recipe-2",)),
+    ]
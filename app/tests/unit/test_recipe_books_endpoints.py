@@ -37,6 +37,11 @@ class StubRecipeBookManager:
         self.recipe_exists_result = True
         self.books_for_recipe_result = [self.recipe_book_by_name.copy()]
         self.add_result = {"book_exists": True, "recipe_exists": True, "added": True}
+        self.add_many_result = {
+            "book_exists": True,
+            "added_recipe_ids": [RECIPE_ID],
+            "missing_recipe_ids": [],
+        }
         self.remove_result = {
             "book_exists": True,
             "recipe_exists": True,
@@ -67,6 +72,9 @@ class StubRecipeBookManager:
     def add_recipe_to_book(self, recipe_book_id: str, recipe_id: str):
         return self.add_result
 
+    def add_recipes_to_book(self, recipe_book_id: str, recipe_ids: list[str]):
+        return self.add_many_result
+
     def remove_recipe_from_book(self, recipe_book_id: str, recipe_id: str):
         return self.remove_result
 
@@ -186,6 +194,49 @@ def test_add_recipe_to_book_endpoint_handles_missing_recipe() -> None:
     assert response.json()["detail"] == "Recipe not found"
 
 
+def test_add_recipes_to_book_endpoint_reports_added_and_missing() -> None:
+    manager = StubRecipeBookManager()
+    missing_id = "33333333-3333-3333-3333-333333333333"
+    manager.add_many_result = {
+        "book_exists": True,
+        "added_recipe_ids": [RECIPE_ID],
+        "missing_recipe_ids": [missing_id],
+    }
+    client = TestClient(build_recipe_books_app(manager))
+
+    response = client.post(
+        f"/api/v1/recipe-books/{BOOK_ID}/recipes/batch",
+        json={"recipe_ids": [RECIPE_ID, missing_id]},
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "recipe_book_id": BOOK_ID,
+        "added_recipe_ids": [RECIPE_ID],
+        "missing_recipe_ids": [missing_id],
+        "added": 1,
+        "success": True,
+    }
+
+
+def test_add_recipes_to_book_endpoint_handles_missing_book() -> None:
+    manager = StubRecipeBookManager()
+    manager.add_many_result = {
+        "book_exists": False,
+        "added_recipe_ids": [],
+        "missing_recipe_ids": [],
+    }
+    client = TestClient(build_recipe_books_app(manager))
+
+    response = client.post(
+        f"/api/v1/recipe-books/{BOOK_ID}/recipes/batch",
+        json={"recipe_ids": [RECIPE_ID]},
+    )
+
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Recipe book not found"
+
+
 def test_remove_recipe_from_book_endpoint_returns_removed() -> None:
     manager = StubRecipeBookManager()
     manager.remove_result = {
@@ -0,0 +1,423 @@
+import uuid
+from contextlib import contextmanager
+from datetime import UTC, datetime
+
+import pytest
+
+from app.api.schemas import Recipe
+from app.core.cache import recipe_cache
+from app.core.config import settings
+from app.core.exceptions import DatabaseError
+from app.services.data.managers.recipe_manager import (
+    CREATE_RECIPE_SQL,
+    INGREDIENTS_FOR_RECIPES_SQL,
+    MAX_INGREDIENT_TEXT_BYTES,
+    NEAREST_EMBEDDINGS_SQL,
+    RECIPE_WITH_CHILDREN_AND_EMBEDDINGS_SQL,
+    SIMILAR_RECIPES_BY_EMBEDDING_SQL,
+    SIMILAR_RECIPES_BY_EMBEDDINGS_SQL,
+    RecipeManager,
+)
+
+RECIPE_ID = "3f2b6a3e-8d3c-4f7e-9a41-2d5c0b7e6f10"
+
+
+class FakeCursor:
+    def __init__(self):
+        self.executed = []
+
+    def execute(self, query, params=None):
+        self.executed.append((query, params))
+
+    def fetchone(self):
+        return {"id": uuid.UUID(RECIPE_ID)}
+
+    def close(self):
+        pass
+
+
+def _patch_db_context(monkeypatch, manager, cursor):
+    def fake_get_db_context():
+        @contextmanager
+        def _ctx():
+            yield None, cursor
+
+        return _ctx()
+
+    monkeypatch.setattr(manager, "get_db_context", fake_get_db_context)
+
+
+def _recipe() -> Recipe:
+    return Recipe(
+        title="Pancakes",
+        ingredients=["1 cup flour", "1 egg", "1 cup milk"],
+        instructions=["Mix.", "Cook."],
+        servings="2",
+        total_time="20 minutes",
+    )
+
+
+def test_create_recipe_inserts_recipe_and_children_in_one_statement(
+    monkeypatch,
+) -> None:
+    manager = RecipeManager()
+    cursor = FakeCursor()
+    _patch_db_context(monkeypatch, manager, cursor)
+
+    recipe_id = manager.create_recipe_from_model(
+        _recipe(), source_url="https://example.com/pancakes"
+    )
+
+    assert cursor.executed == [
+        (
+            CREATE_RECIPE_SQL,
+            (
+                "Pancakes",
+                "2",
+                "20 minutes",
+                "https://example.com/pancakes",
+                True,
+                None,
+                False,
+                ["1 cup flour", "1 egg", "1 cup milk"],
+                ["Mix.", "Cook."],
+                None,
+                None,
+                False,
+            ),
+        )
+    ]
+    assert recipe_id == RECIPE_ID
+
+
+def test_create_recipe_inserts_embedding_in_same_statement(monkeypatch) -> None:
+    manager = RecipeManager()
+    cursor = FakeCursor()
+    _patch_db_context(monkeypatch, manager, cursor)
+
+    recipe_id = manager.create_recipe_from_model(
+        _recipe(), embedding_type="title_ingredients", embedding=[0.1, 0.2]
+    )
+
+    assert recipe_id == RECIPE_ID
+    assert len(cursor.executed) == 1
+    _, params = cursor.executed[0]
+    assert params[-3:] == ("title_ingredients", [0.1, 0.2], True)
+
+
+def test_create_recipe_rejects_ingredient_over_index_limit(monkeypatch) -> None:
+    manager = RecipeManager()
+    cursor = FakeCursor()
+    _patch_db_context(monkeypatch, manager, cursor)
+    recipe = _recipe()
+    recipe.ingredients.append("é" * (MAX_INGREDIENT_TEXT_BYTES // 2 + 1))
+
+    with pytest.raises(DatabaseError, match="ingredient 4"):
+        manager.create_recipe_from_model(recipe)
+
+    assert cursor.executed == []
+
+
+def test_search_recipes_by_embedding_binds_query_vector_once(monkeypatch) -> None:
+    manager = RecipeManager()
+    cursor = FakeCursor()
+    cursor.fetchall = lambda: [{"id": RECIPE_ID, "name": "Pancakes", "distance": 0.1}]
+    _patch_db_context(monkeypatch, manager, cursor)
+
+    results = manager.search_recipes_by_embedding(
+        [0.1, 0.2], "title_ingredients", limit=5, max_distance=0.3
+    )
+
+    assert results == [{"id": RECIPE_ID, "name": "Pancakes", "distance": 0.1}]
+    query, params = cursor.executed[0]
+    assert query == SIMILAR_RECIPES_BY_EMBEDDING_SQL
+    assert params == ([0.1, 0.2], "title_ingredients", False, None, 5, 0.3)
+
+
+def test_search_recipes_by_embeddings_groups_matches_per_query(monkeypatch) -> None:
+    manager = RecipeManager()
+    cursor = FakeCursor()
+    cursor.fetchall = lambda: [
+        {
+            "query_index": 2,
+            "id": RECIPE_ID,
+            "name": "Pancakes",
+            "distance": 0.2,
+        }
+    ]
+    _patch_db_context(monkeypatch, manager, cursor)
+
+    results = manager.search_recipes_by_embeddings(
+        [[0.1, 0.2], [0.3, 0.4]], "title_ingredients", limit=5, max_distance=0.3
+    )
+
+    assert results == [[], [{"id": RECIPE_ID, "name": "Pancakes", "distance": 0.2}]]
+    assert cursor.executed == [
+        (
+            SIMILAR_RECIPES_BY_EMBEDDINGS_SQL,
+            (["[0.1,0.2]", "[0.3,0.4]"], "title_ingredients", False, None, 5, 0.3),
+        )
+    ]
+
+
+def test_find_nearest_embeddings_returns_one_match_per_query(monkeypatch) -> None:
+    manager = RecipeManager()
+    cursor = FakeCursor()
+    cursor.fetchall = lambda: [
+        {
+            "query_index": 1,
+            "recipe_id": RECIPE_ID,
+            "embedding_type": "title_ingredients",
+            "distance": 0.05,
+        }
+    ]
+    _patch_db_context(monkeypatch, manager, cursor)
+
+    results = manager.find_nearest_embeddings(
+        [[0.1, 0.2], [0.3, 0.4]], "title_ingredients", viewer_user_id="user-1"
+    )
+
+    assert results == [
+        {
+            "recipe_id": RECIPE_ID,
+            "embedding_type": "title_ingredients",
+            "distance": 0.05,
+        },
+        None,
+    ]
+    assert cursor.executed == [
+        (
+            NEAREST_EMBEDDINGS_SQL,
+            (["[0.1,0.2]", "[0.3,0.4]"], "title_ingredients", False, "user-1"),
+        )
+    ]
+
+
+def test_get_full_recipe_with_embeddings_uses_one_query(monkeypatch) -> None:
+    manager = RecipeManager()
+    cursor = FakeCursor()
+    cursor.fetchone = lambda: {
+        "id": uuid.UUID(RECIPE_ID),
+        "title": "Pancakes",
+        "ingredients": ["1 egg"],
+        "instructions": None,
+        "embeddings": [
+            {
+                "id": "embedding-1",
+                "embedding_type": "title_ingredients",
+                "embedding": [0.1, 0.2],
+                "created_at": "2024-01-01T00:00:00.000000+00:00",
+            }
+        ],
+    }
+    _patch_db_context(monkeypatch, manager, cursor)
+
+    recipe = manager.get_full_recipe_with_embeddings(RECIPE_ID)
+
+    assert cursor.executed == [
+        (RECIPE_WITH_CHILDREN_AND_EMBEDDINGS_SQL, (RECIPE_ID, False, None))
+    ]
+    assert recipe["instructions"] == []
+    assert recipe["embeddings"][0]["embedding"] == [0.1, 0.2]
+
+
+def test_get_full_recipe_with_embeddings_keeps_embedding_row_shape(
+    monkeypatch,
+) -> None:
+    manager = RecipeManager()
+    cursor = FakeCursor()
+    cursor.fetchone = lambda: {
+        "id": uuid.UUID(RECIPE_ID),
+        "title": "Pancakes",
+        "ingredients": [],
+        "instructions": [],
+        "embeddings": [
+            {
+                "id": "embedding-1",
+                "embedding_type": "title_ingredients",
+                "embedding": [0.1, 0.2],
+                "created_at": "2024-01-01T12:30:45.123456+00:00",
+            }
+        ],
+    }
+    _patch_db_context(monkeypatch, manager, cursor)
+
+    (embedding,) = manager.get_full_recipe_with_embeddings(RECIPE_ID)["embeddings"]
+
+    assert set(embedding) == {"id", "embedding_type", "embedding", "created_at"}
+    assert isinstance(embedding["id"], str)
+    assert isinstance(embedding["embedding_type"], str)
+    assert isinstance(embedding["embedding"], list)
+    assert embedding["created_at"] == datetime(
+        2024, 1, 1, 12, 30, 45, 123456, tzinfo=UTC
+    )
+
+
+class FakeConnection:
+    def __init__(self, rejected_statements=()) -> None:
+        self.cursors = []
+        self.commits = 0
+        self.rollbacks = 0
+        self.rejected_statements = set(rejected_statements)
+
+    def cursor(self):
+        conn = self
+
+        class _Cursor(FakeCursor):
+            def execute(self, query, params=None):
+                if query in conn.rejected_statements:
+                    raise RuntimeError(f"rejected: {query}")
+                super().execute(query, params)
+
+        cursor = _Cursor()
+        self.cursors.append(cursor)
+        return cursor
+
+    def commit(self) -> None:
+        self.commits += 1
+
+    def rollback(self) -> None:
+        self.rollbacks += 1
+
+    def session_settings(self) -> list[str]:
+        return [
+            query
+            for cursor in self.cursors
+            for query, _ in cursor.executed
+            if query.startswith("SET ")
+        ]
+
+
+def _patch_pool(monkeypatch, conn) -> list:
+    import pgvector.psycopg2
+
+    import app.services.data.managers.base as base_module
+
+    registered = []
+
+    @contextmanager
+    def fake_pool_context():
+        yield conn
+
+    monkeypatch.setattr(base_module, "get_db_context", fake_pool_context)
+    monkeypatch.setattr(settings, "DB_HNSW_EF_SEARCH", 100)
+    monkeypatch.setattr(settings, "DB_JIT", False)
+    monkeypatch.setattr(settings, "DB_STATEMENT_TIMEOUT_MS", 30000)
+    monkeypatch.setattr(settings, "DB_IDLE_IN_TRANSACTION_TIMEOUT_MS", 0)
+    monkeypatch.setattr(settings, "DB_PREPARED_STATEMENTS", True)
+    monkeypatch.setattr(pgvector.psycopg2, "register_vector", registered.append)
+    return registered
+
+
+def test_get_db_context_configures_each_connection_once(monkeypatch) -> None:
+    conn = FakeConnection()
+    registered = _patch_pool(monkeypatch, conn)
+    manager = RecipeManager()
+
+    for _ in range(3):
+        with manager.get_db_context():
+            pass
+
+    assert registered == [conn]
+    assert conn.session_settings() == [
+        "SET hnsw.ef_search = 100",
+        "SET statement_timeout = 30000",
+        "SET jit = off",
+    ]
+    assert conn.commits == 3
+
+
+def test_rejected_session_setting_keeps_others_and_retries(monkeypatch, caplog) -> None:
+    conn = FakeConnection(rejected_statements={"SET hnsw.ef_search = 100"})
+    _patch_pool(monkeypatch, conn)
+    manager = RecipeManager()
+
+    with manager.get_db_context():
+        pass
+    assert conn.session_settings() == ["SET statement_timeout = 30000", "SET jit = off"]
+    assert conn.rollbacks == 1
+    assert "SET hnsw.ef_search = 100" in caplog.text
+
+    conn.rejected_statements.clear()
+    with manager.get_db_context():
+        pass
+    with manager.get_db_context():
+        pass
+
+    assert conn.session_settings()[2:] == [
+        "SET hnsw.ef_search = 100",
+        "SET statement_timeout = 30000",
+        "SET jit = off",
+    ]
+
+
+def test_get_full_recipe_serves_repeat_reads_from_cache(monkeypatch) -> None:
+    recipe_cache.clear()
+    manager = RecipeManager()
+    cursor = FakeCursor()
+    cursor.fetchone = lambda: {
+        "id": RECIPE_ID,
+        "title": "Pancakes",
+        "ingredients": ["1 egg"],
+        "instructions": ["Cook."],
+    }
+    cursor.rowcount = 1
+    _patch_db_context(monkeypatch, manager, cursor)
+
+    first = manager.get_full_recipe(RECIPE_ID)
+    second = manager.get_full_recipe(RECIPE_ID)
+    other_viewer = manager.get_full_recipe(RECIPE_ID, viewer_user_id="user-1")
+
+    assert first == second == other_viewer
+    assert len(cursor.executed) == 2
+
+    assert manager.delete_recipe(RECIPE_ID) is True
+    manager.get_full_recipe(RECIPE_ID)
+
+    assert len(cursor.executed) == 4
+    recipe_cache.clear()
+
+
+def test_search_recipes_by_embedding_widens_ef_search_for_large_limits(
+    monkeypatch,
+) -> None:
+    monkeypatch.setattr(settings, "DB_HNSW_EF_SEARCH", 0)
+    manager = RecipeManager()
+    cursor = FakeCursor()
+    cursor.fetchall = lambda: []
+    _patch_db_context(monkeypatch, manager, cursor)
+
+    manager.search_recipes_by_embedding([0.1], "title_ingredients", limit=40)
+    manager.search_recipes_by_embedding([0.1], "title_ingredients", limit=50)
+
+    set_statements = [call for call in cursor.executed if call[0].startswith("SET")]
+    assert set_statements == [("SET LOCAL hnsw.ef_search = %s", (50,))]
+
+
+def test_get_ingredient_previews_limits_rows_in_sql(monkeypatch) -> None:
+    manager = RecipeManager()
+    cursor = FakeCursor()
+    cursor.fetchall = lambda: [
+        {"recipe_id": uuid.UUID(RECIPE_ID), "ingredient_text": "1 egg"},
+        {"recipe_id": uuid.UUID(RECIPE_ID), "ingredient_text": "1 cup milk"},
+    ]
+    _patch_db_context(monkeypatch, manager, cursor)
+
+    previews = manager.get_ingredient_previews(
+        [RECIPE_ID.upper(), "not-a-uuid"], max_ingredients=2
+    )
+
+    assert previews == {RECIPE_ID: ["1 egg", "1 cup milk"]}
+    assert cursor.executed == [
+        (INGREDIENTS_FOR_RECIPES_SQL, (2, [RECIPE_ID], False, None))
+    ]
+
+
+def test_normalize_recipe_ids_keeps_canonical_unique_uuids() -> None:
+    dashless = RECIPE_ID.replace("-", "")
+
+    normalized = RecipeManager._normalize_recipe_ids(
+        [RECIPE_ID, RECIPE_ID.upper(), dashless, "not-a-uuid", None]
+    )
+
+    assert normalized == [RECIPE_ID]
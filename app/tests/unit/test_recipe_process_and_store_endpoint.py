@@ -182,3 +182,62 @@ def test_process_and_store_forwards_visibility_and_creator() -> None:
             "viewer_user_id": "22222222-2222-2222-2222-222222222222",
         }
     ]
+
+
+def test_process_and_store_batch_keeps_order_and_isolates_failures() -> None:
+    processing_service = FakeRecipeProcessingService()
+    recipe_manager = FakeRecipeManager()
+    original_get_full_recipe = recipe_manager.get_full_recipe
+
+    def get_full_recipe(recipe_id: str, **kwargs) -> dict | None:
+        if kwargs.get("include_test_data"):
+            return None
+        return original_get_full_recipe(recipe_id, **kwargs)
+
+    recipe_manager.get_full_recipe = get_full_recipe
+    client = build_client(processing_service, recipe_manager)
+
+    response = client.post(
+        f"{PROCESS_AND_STORE_PATH}/batch",
+        json={
+            "items": [
+                {"raw_input": "Tomato Pasta recipe with ingredients and steps."},
+                {
+                    "raw_input": "Broken recipe that cannot be read back later.",
+                    "isTest": True,
+                },
+            ]
+        },
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["success"] is False
+    assert [result["success"] for result in body["results"]] == [True, False]
+    assert body["results"][0]["recipe_id"] == RECIPE_ID
+    assert body["results"][1]["error"] == "Recipe stored but could not be retrieved"
+    assert len(processing_service.calls) == 2
+
+
+def test_process_and_store_batch_processes_identical_items_once() -> None:
+    processing_service = FakeRecipeProcessingService()
+    client = build_client(processing_service, FakeRecipeManager())
+    item = {"raw_input": "Tomato Pasta recipe with ingredients and steps."}
+
+    response = client.post(
+        f"{PROCESS_AND_STORE_PATH}/batch",
+        json={"items": [item, {**item, "isTest": True}, item]},
+    )
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [result["recipe_id"] for result in results] == [RECIPE_ID] * 3
+    assert [call["is_test"] for call in processing_service.calls] == [False, True]
+
+
+def test_process_and_store_batch_rejects_empty_items() -> None:
+    client = build_client(FakeRecipeProcessingService(), FakeRecipeManager())
+
+    response = client.post(f"{PROCESS_AND_STORE_PATH}/batch", json={"items": []})
+
+    assert response.status_code == 422
@@ -1,4 +1,5 @@
 import socket
+from contextlib import contextmanager
 
 import app.services.recipe_processing_service as recipe_processing_service_module
 from app.api.schemas import Recipe
@@ -97,6 +98,37 @@ def test_cleanup_input_uses_cleanup_service_for_html_payload() -> None:
     assert cleaned.startswith("CLEANED::")
 
 
+def test_cleanup_input_strips_structured_html_without_llm() -> None:
+    class FailingCleanupService:
+        def cleanup_input(self, messy_input: str) -> str:
+            del messy_input
+            raise AssertionError("cleanup_input should not be called for this HTML")
+
+    service = RecipeProcessingService(
+        cleanup_service=FailingCleanupService(),
+        extractor_service=MarkerRecipeExtractor(),
+        recipe_manager=object(),
+        embeddings_service=object(),
+        dedupe_service=object(),
+    )
+
+    cleaned = service._cleanup_input(
+        "<html><head><script>trackVisit();</script></head><body>"
+        "<h1>Simple Tomato Pasta</h1>"
+        "<p>Ingredients:</p><ul><li>200g spaghetti</li>"
+        "<li>1 cup tomato sauce &amp; basil</li></ul>"
+        "<p>Instructions:</p><ol><li>Boil the pasta until tender.</li>"
+        "<li>Toss with the warm sauce and serve.</li></ol>"
+        "</body></html>"
+    )
+
+    assert cleaned is not None
+    assert "trackVisit" not in cleaned
+    assert "<" not in cleaned
+    assert "1 cup tomato sauce & basil" in cleaned
+    assert cleaned.startswith("Simple Tomato Pasta")
+
+
 def test_preview_fails_when_recipe_is_beyond_max_context_window() -> None:
     long_noise = "noise " * 6000
     html = (
@@ -204,11 +236,13 @@ def test_fetch_raw_html_revalidates_redirect_target(monkeypatch) -> None:
     class _RedirectResponse:
         status_code = 302
         headers = {"location": "http://127.0.0.1/private"}
-        text = ""
 
         def raise_for_status(self) -> None:
             return None
 
+        def iter_text(self):
+            return iter(())
+
     class _FakeClient:
         def __init__(self):
             self.calls: list[str] = []
@@ -220,9 +254,11 @@ def test_fetch_raw_html_revalidates_redirect_target(monkeypatch) -> None:
             del exc_type, exc, tb
             return False
 
-        def get(self, url: str):
+        @contextmanager
+        def stream(self, method: str, url: str):
+            assert method == "GET"
             self.calls.append(url)
-            return _RedirectResponse()
+            yield _RedirectResponse()
 
     fake_client = _FakeClient()
     monkeypatch.setattr(
@@ -245,3 +281,23 @@ def test_fetch_raw_html_revalidates_redirect_target(monkeypatch) -> None:
 
     assert html is None
     assert fake_client.calls == ["https://example.com/start"]
+
+
+def test_read_capped_text_stops_streaming_at_limit() -> None:
+    class _ChunkedResponse:
+        url = "https://example.com/huge"
+
+        def __init__(self):
+            self.chunks_read = 0
+
+        def iter_text(self):
+            for _ in range(100):
+                self.chunks_read += 1
+                yield "x" * 10
+
+    response = _ChunkedResponse()
+
+    text = RecipeProcessingService._read_capped_text(response, max_chars=25)
+
+    assert text == "x" * 25
+    assert response.chunks_read == 3
@@ -29,6 +29,7 @@ class FakeRecipeProcessingService:
 
 
 def build_client(service: FakeRecipeProcessingService) -> TestClient:
+    recipes.recipe_preview_cache.clear()
     app = FastAPI()
     app.include_router(recipes.router)
     app.dependency_overrides[get_recipe_processing_service] = lambda: service
@@ -100,3 +101,40 @@ def test_preview_recipe_from_url_rejects_invalid_url() -> None:
 
     assert response.status_code == 422
     assert fake_service.calls == []
+
+
+def test_preview_recipe_from_url_serves_repeat_urls_from_cache() -> None:
+    fake_service = FakeRecipeProcessingService(
+        recipe=Recipe(
+            title="Tomato Pasta",
+            ingredients=["200g spaghetti"],
+            instructions=["Boil pasta"],
+            servings="2",
+            total_time="20 minutes",
+        ),
+    )
+    client = build_client(fake_service)
+    body = {"url": "https://example.com/tomato-pasta"}
+
+    first = client.post(PREVIEW_FROM_URL_PATH, json=body)
+    second = client.post(PREVIEW_FROM_URL_PATH, json=body)
+    refreshed = client.post(f"{PREVIEW_FROM_URL_PATH}?no_cache=true", json=body)
+
+    assert first.json() == second.json() == refreshed.json()
+    assert fake_service.calls == [
+        "https://example.com/tomato-pasta",
+        "https://example.com/tomato-pasta",
+    ]
+
+
+def test_preview_recipe_from_url_does_not_cache_errors() -> None:
+    fake_service = FakeRecipeProcessingService(
+        recipe=None, error="Failed to fetch raw HTML from URL"
+    )
+    client = build_client(fake_service)
+    body = {"url": "https://example.com/missing"}
+
+    client.post(PREVIEW_FROM_URL_PATH, json=body)
+    client.post(PREVIEW_FROM_URL_PATH, json=body)
+
+    assert len(fake_service.calls) == 2
@@ -1,7 +1,8 @@
 import asyncio
 from collections.abc import Sequence
 
-from fastapi import FastAPI
+import anyio.to_thread
+from fastapi import FastAPI, Request
 from fastapi.responses import StreamingResponse
 from fastapi.testclient import TestClient
 
@@ -121,6 +122,29 @@ def test_request_size_limit_blocks_large_payloads() -> None:
     assert response.status_code == 413
 
 
+def test_request_size_limit_blocks_large_chunked_payloads() -> None:
+    app = FastAPI()
+
+    @app.post("/body")
+    async def body(request: Request) -> dict[str, int]:
+        return {"size": len(await request.body())}
+
+    app.add_middleware(RequestSizeLimitMiddleware, max_body_size_bytes=8)
+    client = TestClient(app)
+
+    def chunks(total: int):
+        for _ in range(total):
+            yield b"1234"
+
+    small = client.post("/body", content=chunks(2))
+    large = client.post("/body", content=chunks(3))
+
+    assert small.status_code == 200
+    assert small.json() == {"size": 8}
+    assert large.status_code == 413
+    assert large.json() == {"detail": "Request too large"}
+
+
 def test_request_size_limit_preserves_streaming_responses() -> None:
     app = FastAPI()
 
@@ -184,3 +208,11 @@ def test_create_application_health_is_public_and_other_paths_require_token(
     assert health_response.json() == {"status": "ok"}
     assert protected_response.status_code == 401
     assert authed_response.status_code == 404
+
+
+def test_configure_threadpool_raises_worker_limit() -> None:
+    async def configure_and_read() -> float:
+        main_module._configure_threadpool(7)
+        return anyio.to_thread.current_default_thread_limiter().total_tokens
+
+    assert asyncio.run(configure_and_read()) == 7
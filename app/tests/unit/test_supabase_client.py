@@ -0,0 +1,75 @@
+import threading
+
+import pytest
+
+from app.core.config import settings
+from app.core.exceptions import ConnectionPoolError
+from app.services.data import supabase_client
+
+
+class FakePool:
+    def __init__(self) -> None:
+        self.returned = []
+
+    def getconn(self):
+        return object()
+
+    def putconn(self, conn) -> None:
+        self.returned.append(conn)
+
+    def closeall(self) -> None:
+        pass
+
+
+def _use_pool(monkeypatch, pool, slots: int = 1) -> threading.BoundedSemaphore:
+    semaphore = threading.BoundedSemaphore(slots)
+    monkeypatch.setattr(supabase_client, "_connection_pool", pool)
+    monkeypatch.setattr(supabase_client, "_connection_slots", semaphore)
+    monkeypatch.setattr(supabase_client, "_checkouts", {})
+    monkeypatch.setattr(settings, "DB_POOL_TIMEOUT_SECONDS", 0.01)
+    return semaphore
+
+
+def test_get_db_connection_waits_for_a_free_slot(monkeypatch) -> None:
+    pool = FakePool()
+    _use_pool(monkeypatch, pool)
+
+    conn = supabase_client.get_db_connection()
+    with pytest.raises(ConnectionPoolError):
+        supabase_client.get_db_connection()
+
+    supabase_client.return_db_connection(conn)
+    assert pool.returned == [conn]
+    assert supabase_client.get_db_connection() is not None
+
+
+def test_return_after_close_releases_the_checkout_slot(monkeypatch) -> None:
+    pool = FakePool()
+    slots = _use_pool(monkeypatch, pool)
+    conn = supabase_client.get_db_connection()
+
+    supabase_client.close_connection_pool()
+    supabase_client.return_db_connection(conn)
+
+    assert pool.returned == []
+    assert slots.acquire(blocking=False)
+
+
+def test_return_after_reinit_releases_the_old_slot_only(monkeypatch) -> None:
+    old_pool = FakePool()
+    old_slots = _use_pool(monkeypatch, old_pool)
+    conn = supabase_client.get_db_connection()
+
+    new_pool = FakePool()
+    new_slots = threading.BoundedSemaphore(1)
+    monkeypatch.setattr(supabase_client, "_connection_pool", new_pool)
+    monkeypatch.setattr(supabase_client, "_connection_slots", new_slots)
+    new_conn = supabase_client.get_db_connection()
+    supabase_client.return_db_connection(conn)
+
+    assert old_pool.returned == new_pool.returned == []
+    assert old_slots.acquire(blocking=False)
+    assert not new_slots.acquire(blocking=False)
+
+    supabase_client.return_db_connection(new_conn)
+    assert new_pool.returned == [new_conn]
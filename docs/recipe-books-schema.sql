@@ -6,11 +6,16 @@ CREATE TABLE IF NOT EXISTS recipe_books (
     name VARCHAR(255) NOT NULL,
     normalized_name VARCHAR(255) NOT NULL UNIQUE,
     description TEXT NULL,
+    recipe_count INTEGER NOT NULL DEFAULT 0,
     created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
     updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
     CONSTRAINT recipe_books_name_not_blank CHECK (length(trim(name)) > 0)
 );
 
+-- Lookups by name go through the btree index backing the UNIQUE constraint on
+-- normalized_name (recipe_books_normalized_name_key). The application both
+-- lowercases and collapses whitespace before storing/querying it, so CITEXT or
+-- a lower(name) functional index would not be equivalent and is not needed.
 CREATE INDEX IF NOT EXISTS idx_recipe_books_name ON recipe_books(name);
 CREATE INDEX IF NOT EXISTS idx_recipe_books_created_at ON recipe_books(created_at DESC);
 
@@ -23,3 +28,66 @@ CREATE TABLE IF NOT EXISTS recipe_book_recipes (
 
 CREATE INDEX IF NOT EXISTS idx_recipe_book_recipes_recipe_id
     ON recipe_book_recipes(recipe_id);
+
+-- Denormalized recipe_count so listing books doesn't re-aggregate the link
+-- table. It counts only non-test recipes, the same filter the full-book
+-- queries apply to recipe_ids, so recipe_count matches len(recipe_ids).
+ALTER TABLE recipe_books
+    ADD COLUMN IF NOT EXISTS recipe_count INTEGER NOT NULL DEFAULT 0;
+
+UPDATE recipe_books rb
+SET recipe_count = (
+    SELECT COUNT(*)
+    FROM recipe_book_recipes rbr
+    JOIN recipes r ON r.id = rbr.recipe_id
+    WHERE rbr.recipe_book_id = rb.id
+      AND COALESCE(r.is_test_data, FALSE) = FALSE
+);
+
+-- Recount the affected books instead of adding or subtracting one: a link
+-- removed by ON DELETE CASCADE from recipes no longer has a recipe row to
+-- tell whether it was test data. The count reads each book's slice of the
+-- link table's primary key, so it stays cheap.
+--
+-- The triggers are statement-level, so one batch insert recounts each book
+-- once. The books are locked first (in id order, to avoid deadlocks): under
+-- READ COMMITTED, the UPDATE that follows then starts with a fresh snapshot
+-- and sees links committed by a concurrent transaction that held the lock.
+-- Both triggers name their transition table changed_links.
+CREATE OR REPLACE FUNCTION sync_recipe_book_recipe_count()
+RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM 1
+    FROM recipe_books rb
+    WHERE rb.id IN (SELECT recipe_book_id FROM changed_links)
+    ORDER BY rb.id
+    FOR UPDATE;
+
+    UPDATE recipe_books rb
+    SET recipe_count = (
+        SELECT COUNT(*)
+        FROM recipe_book_recipes rbr
+        JOIN recipes r ON r.id = rbr.recipe_id
+        WHERE rbr.recipe_book_id = rb.id
+          AND COALESCE(r.is_test_data, FALSE) = FALSE
+    )
+    WHERE rb.id IN (SELECT recipe_book_id FROM changed_links);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS recipe_book_recipes_sync_count ON recipe_book_recipes;
+
+DROP TRIGGER IF EXISTS recipe_book_recipes_sync_count_insert ON recipe_book_recipes;
+CREATE TRIGGER recipe_book_recipes_sync_count_insert
+    AFTER INSERT ON recipe_book_recipes
+    REFERENCING NEW TABLE AS changed_links
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION sync_recipe_book_recipe_count();
+
+DROP TRIGGER IF EXISTS recipe_book_recipes_sync_count_delete ON recipe_book_recipes;
+CREATE TRIGGER recipe_book_recipes_sync_count_delete
+    AFTER DELETE ON recipe_book_recipes
+    REFERENCING OLD TABLE AS changed_links
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION sync_recipe_book_recipe_count();
@@ -0,0 +1,53 @@
+-- Covering index for recipe ingredient reads in ForkFolio.
+-- Run after the base recipe schema is in place.
+--
+-- Every full recipe read aggregates a recipe's ingredients in order, by
+-- recipe_id. With ingredient_text included in the (recipe_id, order_index)
+-- index, Postgres can answer that read with an index only scan and skip the
+-- heap.
+--
+-- ingredient_text goes into the index behind the existing UNIQUE constraint,
+-- so each ingredient insert still maintains one btree for these columns. The
+-- constraint keeps its name. The plain composite indexes from the base schema
+-- become redundant and are dropped.
+--
+-- Size limit: a btree entry can be at most about 2704 bytes (a third of an
+-- 8 kB page). An INCLUDE column counts towards that limit, so an ingredient
+-- line longer than that fails its INSERT, and with it the whole recipe
+-- insert. RecipeManager.create_recipe_from_model rejects ingredient lines
+-- over MAX_INGREDIENT_TEXT_BYTES (2000 bytes of UTF-8) before it writes
+-- anything. Instruction steps can legitimately run long, so instruction_text
+-- stays out of the index. Its UNIQUE constraint is restored to a plain
+-- (recipe_id, step_number) index in case an earlier version of this script
+-- added the column.
+
+create unique index if not exists unique_recipe_ingredient_order_covering
+    on public.recipe_ingredients (recipe_id, order_index)
+    include (ingredient_text);
+
+alter table public.recipe_ingredients
+    drop constraint if exists unique_recipe_ingredient_order;
+alter table public.recipe_ingredients
+    add constraint unique_recipe_ingredient_order
+    unique using index unique_recipe_ingredient_order_covering;
+
+create unique index if not exists unique_recipe_instruction_step_plain
+    on public.recipe_instructions (recipe_id, step_number);
+
+alter table public.recipe_instructions
+    drop constraint if exists unique_recipe_instruction_step;
+alter table public.recipe_instructions
+    add constraint unique_recipe_instruction_step
+    unique using index unique_recipe_instruction_step_plain;
+
+drop index if exists public.idx_recipe_ingredients_recipe_order;
+drop index if exists public.idx_recipe_instructions_recipe_step;
+drop index if exists public.idx_recipe_ingredients_recipe_order_covering;
+drop index if exists public.idx_recipe_instructions_recipe_step_covering;
+
+-- Separate step: index-only scans rely on the visibility map. VACUUM cannot
+-- run inside a transaction block (the Supabase SQL editor runs a script as
+-- one), so run this statement on its own afterwards. Autovacuum keeps the map
+-- current from then on.
+--
+-- vacuum analyze public.recipe_ingredients;
@@ -0,0 +1,22 @@
+-- Per-type vector index for recipe embedding search in ForkFolio.
+-- Run after the base recipe schema is in place.
+--
+-- Semantic search and dedupe always filter on one embedding_type. A partial
+-- HNSW index per type is smaller than one index over every row, and the
+-- planner can use it for ORDER BY embedding <=> query LIMIT k. Add one index
+-- per embedding_type the application writes.
+--
+-- The application sets hnsw.ef_search once per pooled connection from
+-- [database] hnsw_ef_search in config/app.config.ini (default 100). Keep it
+-- at or above the largest search limit; HNSW returns at most ef_search rows.
+-- It also turns JIT off per connection unless [database] jit = true.
+--
+-- The index predicate is matched at plan time, so a generic plan for a
+-- statement that binds embedding_type as a parameter cannot use it. The
+-- application therefore does not PREPARE its vector lookups.
+
+create index if not exists idx_recipe_embeddings_title_ingredients_hnsw
+    on public.recipe_embeddings
+    using hnsw (embedding vector_cosine_ops)
+    with (m = 16, ef_construction = 64)
+    where embedding_type = 'title_ingredients';
@@ -0,0 +1,12 @@
+-- Recipe title search index for ForkFolio.
+-- Run after the base recipe schema is in place.
+--
+-- RecipeManager.find_recipes_by_title_query matches with title ILIKE '%term%'.
+-- A btree on title cannot serve an infix pattern, so without this index every
+-- lookup scans recipes. pg_trgm's GIN operator class indexes ILIKE directly,
+-- so the query text does not change.
+
+create extension if not exists pg_trgm;
+
+create index if not exists idx_recipes_title_trgm
+    on public.recipes using gin (title gin_trgm_ops);
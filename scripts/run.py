@@ -61,6 +61,18 @@ def _parse_args() -> argparse.Namespace:
         action="store_false",
         help="Disable auto-reload (default).",
     )
+    parser.add_argument(
+        "--loop",
+        choices=("auto", "asyncio", "uvloop"),
+        default=os.getenv("UVICORN_LOOP", "auto").strip() or "auto",
+        help="Event loop implementation. 'auto' uses uvloop when installed.",
+    )
+    parser.add_argument(
+        "--http",
+        choices=("auto", "h11", "httptools"),
+        default=os.getenv("UVICORN_HTTP", "auto").strip() or "auto",
+        help="HTTP protocol implementation. 'auto' uses httptools when installed.",
+    )
     return parser.parse_args()
 
 
@@ -73,4 +85,6 @@ if __name__ == "__main__":
         host=args.host,
         port=_resolve_port(args.port),
         reload=args.reload,
+        loop=args.loop,
+        http=args.http,
     )